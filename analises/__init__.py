@@ -1,11 +1,13 @@
 # analises/__init__.py
 
 # 1. Importa utilitários da base (se outros módulos precisarem deles)
-from .base import get_total_registros, get_iqr_boundaries, obter_percentual_nan
+from .base import get_total_registros, get_iqr_boundaries, obter_percentual_nan, obter_valores_ordenados, contar_fora_intervalo, estimar_distintos
 
 # 2. Importa as funções principais de análise
 from .integridade import validacao_chave_primaria
 from .numericas import estatisticas_descritivas, teste_de_outliers_iqr, teste_de_outliers_zscore, analise_de_correlacao
+from .perfil import perfil_tabela
+from .drift import analise_de_drift, perfil_coluna, calcular_psi, calcular_ks
 
 # O '__all__' lista todas as funções que o pacote expõe
 __all__ = [
@@ -13,10 +15,19 @@ __all__ = [
     'get_total_registros',
     'get_iqr_boundaries',
     'obter_percentual_nan',
+    'obter_valores_ordenados',
+    'contar_fora_intervalo',
+    'estimar_distintos',
     # Análises Principais
     'validacao_chave_primaria',
     'estatisticas_descritivas',
     'teste_de_outliers_iqr',
     'teste_de_outliers_zscore',
-    'analise_de_correlacao'
+    'analise_de_correlacao',
+    'perfil_tabela',
+    'analise_de_drift',
+    # Perfis e drift entre execuções
+    'perfil_coluna',
+    'calcular_psi',
+    'calcular_ks'
 ]
\ No newline at end of file
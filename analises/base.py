@@ -1,7 +1,8 @@
 # analises/base.py
 
 import pandas as pd
-from typing import Tuple, Optional
+import numpy as np
+from typing import Tuple, Optional, Dict
 
 def get_total_registros(df: pd.DataFrame) -> int:
     """
@@ -38,4 +39,59 @@ def obter_percentual_nan(df: pd.DataFrame, col: str) -> float:
         return 0.0
         
     nulos_count = df[col].isnull().sum()
-    return (nulos_count / total_registros) * 100.0
\ No newline at end of file
+    return (nulos_count / total_registros) * 100.0
+
+def obter_valores_ordenados(df: pd.DataFrame, col: str, indice: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """
+    Retorna os valores não nulos da coluna, ordenados. Se 'indice' for informado,
+    funciona como cache por tabela: a ordenação é feita uma única vez por coluna.
+    """
+    if indice is not None and col in indice:
+        return indice[col]
+
+    valores = np.sort(df[col].dropna().to_numpy(dtype=float))
+    if indice is not None:
+        indice[col] = valores
+    return valores
+
+def contar_fora_intervalo(valores_ordenados: np.ndarray, limite_inferior: float, limite_superior: float) -> int:
+    """
+    Conta, por busca binária (O(log n)), quantos valores estão fora de
+    [limite_inferior, limite_superior] em um array já ordenado.
+    """
+    abaixo = np.searchsorted(valores_ordenados, limite_inferior, side='left')
+    acima = len(valores_ordenados) - np.searchsorted(valores_ordenados, limite_superior, side='right')
+    return int(abaixo + acima)
+
+def estimar_distintos(series: pd.Series, precisao: int = 14) -> int:
+    """
+    Estima o número de valores distintos (não nulos) com HyperLogLog vetorizado
+    sobre o hash de cada valor. Erro padrão ~ 1.04 / sqrt(2 ** precisao).
+    """
+    valores = series.dropna()
+    if valores.empty:
+        return 0
+
+    m = 1 << precisao
+    bits_restantes = 64 - precisao
+    hashes = pd.util.hash_pandas_object(valores, index=False).to_numpy()
+
+    registradores_idx = (hashes >> np.uint64(bits_restantes)).astype(np.int64)
+    resto = hashes & np.uint64((1 << bits_restantes) - 1)
+    # Posição do primeiro bit 1 no resto (contando da esquerda, a partir de 1)
+    with np.errstate(divide='ignore'):
+        comprimento = np.where(resto > 0, np.floor(np.log2(resto.astype(np.float64))) + 1, 0)
+    rank = (bits_restantes - comprimento + 1).astype(np.uint8)
+
+    registradores = np.zeros(m, dtype=np.uint8)
+    np.maximum.at(registradores, registradores_idx, rank)
+
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimativa = alpha * m * m / np.sum(np.power(2.0, -registradores.astype(np.float64)))
+
+    # Correção para cardinalidades pequenas (linear counting)
+    vazios = int(np.count_nonzero(registradores == 0))
+    if estimativa <= 2.5 * m and vazios > 0:
+        estimativa = m * np.log(m / vazios)
+
+    return int(round(estimativa))
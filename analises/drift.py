@@ -0,0 +1,144 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List
+
+from .base import obter_valores_ordenados
+from data_loader.historico import CAMINHO_HISTORICO_PADRAO, gerar_id_execucao, salvar_perfis, carregar_perfil
+
+# ----------------------------------------------------------------------
+# PERFIL COMPACTO DE COLUNA (sketch)
+# ----------------------------------------------------------------------
+
+# Grade fixa de probabilidades do sketch de quantis (0%, 1%, ..., 100%)
+PROBABILIDADES_SKETCH = np.linspace(0.0, 1.0, 101)
+
+def perfil_coluna(df: pd.DataFrame, col: str, n_bins: int = 10, indice: Dict[str, np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Calcula o perfil compacto de uma coluna numérica: momentos, sketch de
+    quantis, histograma, taxa de nulos e número de valores distintos.
+    """
+    total_registros = len(df)
+    valores = obter_valores_ordenados(df, col, indice)
+    n = len(valores)
+
+    perfil = {
+        "total_registros": total_registros,
+        "count": n,
+        "taxa_nulos": (total_registros - n) / total_registros if total_registros else 0.0
+    }
+    if n == 0:
+        return perfil
+
+    contagens, limites = np.histogram(valores, bins=n_bins)
+    perfil.update({
+        "mean": float(valores.mean()),
+        "std": float(valores.std(ddof=1)) if n > 1 else 0.0,
+        "min": float(valores[0]),
+        "max": float(valores[-1]),
+        # Valores ordenados: distintos = 1 + número de transições
+        "distintos": int(1 + np.count_nonzero(np.diff(valores))),
+        "quantis": np.quantile(valores, PROBABILIDADES_SKETCH).tolist(),
+        "histograma": {"limites": limites.tolist(), "contagens": contagens.tolist()}
+    })
+    return perfil
+
+# ----------------------------------------------------------------------
+# DRIFT ENTRE PERFIS (somente a partir dos sketches)
+# ----------------------------------------------------------------------
+
+def _cdf_sketch(perfil: Dict[str, Any], x: np.ndarray) -> np.ndarray:
+    """CDF aproximada (interpolação linear) a partir do sketch de quantis."""
+    return np.interp(x, perfil['quantis'], PROBABILIDADES_SKETCH, left=0.0, right=1.0)
+
+def calcular_ks(perfil_ref: Dict[str, Any], perfil_atual: Dict[str, Any]) -> float:
+    """
+    Estatística KS aproximada: maior distância entre as CDFs dos dois sketches,
+    avaliada na união dos pontos de quantil.
+    """
+    pontos = np.union1d(perfil_ref['quantis'], perfil_atual['quantis'])
+    return float(np.max(np.abs(_cdf_sketch(perfil_ref, pontos) - _cdf_sketch(perfil_atual, pontos))))
+
+def calcular_psi(perfil_ref: Dict[str, Any], perfil_atual: Dict[str, Any], n_faixas: int = 10, epsilon: float = 1e-4) -> float:
+    """
+    Population Stability Index com faixas definidas pelos quantis da referência
+    (decis, por padrão); as proporções atuais vêm da CDF do sketch atual.
+    """
+    passo = (len(PROBABILIDADES_SKETCH) - 1) // n_faixas
+    cortes = np.unique(np.asarray(perfil_ref['quantis'])[passo:-1:passo])
+
+    prop_ref = np.diff(np.concatenate(([0.0], _cdf_sketch(perfil_ref, cortes), [1.0])))
+    prop_atual = np.diff(np.concatenate(([0.0], _cdf_sketch(perfil_atual, cortes), [1.0])))
+    prop_ref = np.clip(prop_ref, epsilon, None)
+    prop_atual = np.clip(prop_atual, epsilon, None)
+
+    return float(np.sum((prop_atual - prop_ref) * np.log(prop_atual / prop_ref)))
+
+# ----------------------------------------------------------------------
+# ANALISE DE DRIFT
+# ----------------------------------------------------------------------
+
+def analise_de_drift(df: pd.DataFrame, colunas: List[str], **parametros: Any) -> Dict[str, Any]:
+    """
+    Compara o perfil atual de cada coluna com o perfil gravado no histórico
+    (execução anterior mais recente, ou 'id_execucao_referencia') e grava o
+    perfil atual para as próximas execuções.
+    """
+    caminho_historico = parametros.get('caminho_historico', CAMINHO_HISTORICO_PADRAO)
+    id_referencia = parametros.get('id_execucao_referencia')
+    limite_psi = parametros.get('limite_psi', 0.25)
+    limite_ks = parametros.get('limite_ks', 0.1)
+    gravar_historico = parametros.get('gravar_historico', True)
+    tabela = parametros.get('tabela_nome', 'N/A')
+    id_execucao = parametros.get('id_execucao') or gerar_id_execucao()
+    indice = parametros.get('indice_ordenado')
+
+    colunas_validas = [col for col in colunas if col in df.columns]
+
+    if not colunas_validas:
+        return {
+            "colunas_alvo": colunas,
+            "status": "ERRO",
+            "resumo_texto": "Nenhuma coluna válida foi encontrada no DataFrame para análise de drift.",
+            "dados_resultado": {}
+        }
+
+    perfis_atuais = {col: perfil_coluna(df, col, indice=indice) for col in colunas_validas}
+
+    dados_resultado = {}
+    colunas_com_drift = 0
+    for col, perfil_atual in perfis_atuais.items():
+        perfil_ref = carregar_perfil(caminho_historico, tabela, col, id_execucao=id_referencia, antes_de=id_execucao)
+
+        if perfil_ref is None or 'quantis' not in perfil_ref or 'quantis' not in perfil_atual:
+            dados_resultado[col] = {"status": "Sem histórico"}
+            continue
+
+        psi = calcular_psi(perfil_ref, perfil_atual)
+        ks = calcular_ks(perfil_ref, perfil_atual)
+        if psi >= limite_psi or ks >= limite_ks:
+            colunas_com_drift += 1
+
+        dados_resultado[col] = {
+            "psi": round(psi, 4),
+            "ks": round(ks, 4),
+            "limite_psi": limite_psi,
+            "limite_ks": limite_ks,
+            "taxa_nulos_referencia": perfil_ref['taxa_nulos'],
+            "taxa_nulos_atual": perfil_atual['taxa_nulos'],
+            "mean_referencia": perfil_ref['mean'],
+            "mean_atual": perfil_atual['mean'],
+            "id_execucao_referencia": perfil_ref['id_execucao']
+        }
+
+    if gravar_historico:
+        salvar_perfis(caminho_historico, tabela, id_execucao, perfis_atuais)
+
+    status_final = "ALERTA" if colunas_com_drift > 0 else "SUCESSO"
+    resumo = f"Análise de drift concluída. {colunas_com_drift} de {len(colunas_validas)} coluna(s) com drift (PSI ≥ {limite_psi} ou KS ≥ {limite_ks})."
+
+    return {
+        "colunas_alvo": colunas_validas,
+        "status": status_final,
+        "resumo_texto": resumo,
+        "dados_resultado": dados_resultado
+    }
@@ -14,6 +14,9 @@ def validacao_chave_primaria(df: pd.DataFrame, colunas: List[str], **parametros:
         df (pd.DataFrame): O DataFrame a ser analisado.
         colunas (List[str]): Lista contendo o nome da coluna da chave primária.
         parametros (Any): Parâmetros adicionais da regra (checar_unicidade, checar_nulos, etc.).
+            Com 'usar_hash' = True, a unicidade é verificada sobre o hash de 64 bits
+            de cada valor (variante mais barata para chaves textuais grandes;
+            colisões são improváveis, mas possíveis).
 
     Returns:
         Dict[str, Any]: Um dicionário padronizado (ResultadoAnalise) com os resultados da validação.
@@ -43,7 +46,11 @@ def validacao_chave_primaria(df: pd.DataFrame, colunas: List[str], **parametros:
     
     # 2. Checagem de Unicidade
     # Conta todas as linhas que possuem um valor duplicado (mantendo False)
-    duplicados_count = df[pk_col].duplicated(keep=False).sum()
+    if parametros.get('usar_hash', False):
+        hashes = pd.Series(pd.util.hash_pandas_object(df[pk_col], index=False).to_numpy())
+        duplicados_count = hashes.duplicated(keep=False).sum()
+    else:
+        duplicados_count = df[pk_col].duplicated(keep=False).sum()
     
     # 3. Determinando o Status e Resumo
     if nulos_count > 0 or duplicados_count > 0:
@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, List
 
+from .base import obter_valores_ordenados, contar_fora_intervalo
+
 # ----------------------------------------------------------------------
 # ESTATISTICAS DESCRITIVAS
 # ----------------------------------------------------------------------
@@ -60,40 +62,52 @@ def estatisticas_descritivas(df: pd.DataFrame, colunas: List[str], **parametros:
 def teste_de_outliers_iqr(df: pd.DataFrame, colunas: List[str], **parametros: Any) -> Dict[str, Any]:
     """
     Identifica outliers usando o método do Intervalo Interquartil (IQR).
+    'multiplicador_iqr' aceita um valor ou uma lista; com lista, cada coluna recebe
+    também a 'sensibilidade' (contagem por multiplicador), e o primeiro valor é
+    usado como principal. As contagens usam o índice ordenado da coluna
+    ('indice_ordenado', compartilhado por tabela), por busca binária.
     """
     
     multiplicador_iqr = parametros.get('multiplicador_iqr', 1.5)
+    multiplicadores = multiplicador_iqr if isinstance(multiplicador_iqr, list) else [multiplicador_iqr]
+    indice = parametros.get('indice_ordenado')
     
     colunas_validas = [col for col in colunas if col in df.columns]
     dados_resultado = {}
     total_outliers = 0
     
     for col in colunas_validas:
-        col_series = df[col].dropna()
-        if col_series.empty:
+        valores = obter_valores_ordenados(df, col, indice)
+        if len(valores) == 0:
              dados_resultado[col] = {"outliers_count": 0, "status": "Vazio"}
              continue
 
-        Q1 = col_series.quantile(0.25)
-        Q3 = col_series.quantile(0.75)
+        Q1, Q3 = np.quantile(valores, [0.25, 0.75])
         IQR = Q3 - Q1
+
+        sensibilidade = []
+        for multiplicador in multiplicadores:
+            limite_inferior = Q1 - (multiplicador * IQR)
+            limite_superior = Q3 + (multiplicador * IQR)
+            sensibilidade.append({
+                "multiplicador_iqr": multiplicador,
+                "outliers_count": contar_fora_intervalo(valores, limite_inferior, limite_superior),
+                "limite_inferior": float(limite_inferior),
+                "limite_superior": float(limite_superior)
+            })
         
-        limite_inferior = Q1 - (multiplicador_iqr * IQR)
-        limite_superior = Q3 + (multiplicador_iqr * IQR)
-        
-        outliers_count = col_series[
-            (col_series < limite_inferior) | (col_series > limite_superior)
-        ].count()
-        
-        total_outliers += outliers_count
+        principal = sensibilidade[0]
+        total_outliers += principal["outliers_count"]
 
         dados_resultado[col] = {
-            "outliers_count": int(outliers_count),
-            "limite_inferior": float(limite_inferior),
-            "limite_superior": float(limite_superior),
+            "outliers_count": principal["outliers_count"],
+            "limite_inferior": principal["limite_inferior"],
+            "limite_superior": principal["limite_superior"],
             "Q1": float(Q1),
             "Q3": float(Q3)
         }
+        if isinstance(multiplicador_iqr, list):
+            dados_resultado[col]["sensibilidade"] = sensibilidade
 
     status_final = "ALERTA" if total_outliers > 0 else "SUCESSO"
     resumo = f"Teste IQR concluído. Total de outliers encontrados: {total_outliers}."
@@ -108,42 +122,55 @@ def teste_de_outliers_iqr(df: pd.DataFrame, colunas: List[str], **parametros: An
 def teste_de_outliers_zscore(df: pd.DataFrame, colunas: List[str], **parametros: Any) -> Dict[str, Any]:
     """
     Identifica outliers usando o Z-Score.
+    'limite_zscore' aceita um valor ou uma lista (ver teste_de_outliers_iqr):
+    |z| > k equivale a x fora de [mean - k*std, mean + k*std], contado por
+    busca binária no índice ordenado.
     """
     
     limite_zscore = parametros.get('limite_zscore', 3.0)
+    limites = limite_zscore if isinstance(limite_zscore, list) else [limite_zscore]
+    indice = parametros.get('indice_ordenado')
     
     colunas_validas = [col for col in colunas if col in df.columns]
     dados_resultado = {}
     total_outliers = 0
     
     for col in colunas_validas:
-        col_series = df[col].dropna()
-        if col_series.empty:
+        valores = obter_valores_ordenados(df, col, indice)
+        if len(valores) == 0:
              dados_resultado[col] = {"outliers_count": 0, "status": "Vazio"}
              continue
 
-        # Calcula Z-score
-        mean = col_series.mean()
-        std = col_series.std()
+        # Média e desvio padrão amostral (ddof=1, como no pandas)
+        mean = valores.mean()
+        std = valores.std(ddof=1) if len(valores) > 1 else np.nan
         
-        if std == 0:
+        if std == 0 or np.isnan(std):
             dados_resultado[col] = {"outliers_count": 0, "status": "STD Zero"}
             continue
-            
-        z_scores = (col_series - mean) / std
+
+        sensibilidade = [
+            {
+                "limite_zscore": limite,
+                "outliers_count": contar_fora_intervalo(valores, mean - limite * std, mean + limite * std)
+            }
+            for limite in limites
+        ]
         
-        outliers_count = z_scores[np.abs(z_scores) > limite_zscore].count()
+        outliers_count = sensibilidade[0]["outliers_count"]
         total_outliers += outliers_count
 
         dados_resultado[col] = {
-            "outliers_count": int(outliers_count),
-            "limite_zscore": limite_zscore,
+            "outliers_count": outliers_count,
+            "limite_zscore": limites[0],
             "mean": float(mean),
             "std": float(std)
         }
+        if isinstance(limite_zscore, list):
+            dados_resultado[col]["sensibilidade"] = sensibilidade
 
     status_final = "ALERTA" if total_outliers > 0 else "SUCESSO"
-    resumo = f"Teste Z-Score concluído. Total de outliers encontrados: {total_outliers} (Z > {limite_zscore})."
+    resumo = f"Teste Z-Score concluído. Total de outliers encontrados: {total_outliers} (Z > {limites[0]})."
 
     return {
         "colunas_alvo": colunas_validas,
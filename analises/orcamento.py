@@ -0,0 +1,333 @@
+# analises/orcamento.py
+
+import importlib
+import multiprocessing
+import os
+import signal
+import sqlite3
+import time
+import pandas as pd
+from typing import Dict, Any, List, Optional, Tuple, Callable
+
+try:
+    import resource
+except ImportError:  # Windows: limite de memória não é aplicado
+    resource = None
+
+# ----------------------------------------------------------------------
+# EXECUÇÃO SUPERVISIONADA COM ORÇAMENTO E FALLBACK
+# ----------------------------------------------------------------------
+# Configuração (eda_analises.json):
+#   - por regra:   "orcamento": {"max_segundos": 300, "max_mb": 4096}
+#                  "fallback":  {"amostra_linhas": 100000, "max_colunas": 200,
+#                                "parametros": {...}, "funcao_analise": "..."}
+#   - por tabela:  "orcamentos_tabela": {"<nome_tabela>": {"max_segundos": ..., "max_mb": ...}}
+# O 'max_segundos' da tabela é um prazo TOTAL: vale para todas as regras da
+# tabela e suas variantes de fallback somadas. Cada execução recebe o menor
+# entre o 'max_segundos' da regra e o tempo restante até o prazo da tabela;
+# esgotado o prazo, as regras restantes não são executadas (status ERRO).
+# 'max_mb' (o menor entre regra e tabela) limita a memória ADICIONAL que cada
+# worker pode alocar (RLIMIT_AS; disponível apenas em sistemas Unix).
+#
+# Quando a regra excede o orçamento, o worker é encerrado e a variante de
+# fallback (amostra de linhas, subconjunto de colunas, parâmetros mais baratos
+# e/ou outra função do mesmo módulo) é executada sob o mesmo orçamento da
+# regra, limitado ao que resta do prazo da tabela.
+# O resultado recebe a chave 'fallback' descrevendo a precisão reduzida.
+#
+# Outros caminhos de execução:
+#   - pushdown SQL (fontes 'sqlite'): 'max_segundos' é aplicado interrompendo a
+#     consulta (progress handler do SQLite); 'max_mb' não se aplica e é ignorado
+#     com aviso. Não há fallback: a regra excedida retorna status ERRO.
+#   - modo particionado: as regras compartilham os mesmos workers, então o
+#     orçamento não é aplicado; um aviso é emitido para cada regra afetada.
+#
+# Custo de memória: o worker é iniciado via forkserver (ver
+# obter_contexto_processos), então os dados são serializados para ele. Apenas
+# as colunas alvo da regra (e as entradas correspondentes do índice ordenado)
+# são enviadas, mas uma regra sobre todas as colunas (ex: perfil_tabela) ocupa
+# cerca de 3x o tamanho da tabela no pico: o original, o buffer serializado no
+# processo principal e a cópia no worker. 'max_mb' limita apenas a alocação
+# adicional do worker. Por isso nenhuma regra tem orçamento na configuração
+# padrão; habilite-o onde o risco de uma regra travar a execução for maior.
+
+CHAVES_ORCAMENTO = ('max_segundos', 'max_mb')
+
+# Espera máxima pelo encerramento do worker após terminate()/kill()
+TIMEOUT_ENCERRAMENTO_SEGUNDOS = 5
+
+def iniciar_orcamento_tabela(tabela_nome: str, analises_config: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Orçamento da tabela ('orcamentos_tabela'), chamado ao iniciar a tabela:
+    'max_segundos' é convertido no prazo absoluto 'prazo' (relógio monotônico).
+    """
+    orcamento_tabela = dict(analises_config.get('orcamentos_tabela', {}).get(tabela_nome, {}))
+    if orcamento_tabela.get('max_segundos') is not None:
+        orcamento_tabela['prazo'] = time.monotonic() + orcamento_tabela['max_segundos']
+    return orcamento_tabela
+
+def limitar_ao_prazo(orcamento: Dict[str, float], prazo: Optional[float]) -> Dict[str, float]:
+    """
+    Reduz 'max_segundos' ao tempo restante até 'prazo' (0 se já esgotado).
+    """
+    if prazo is None:
+        return orcamento
+    restante = round(max(0.0, prazo - time.monotonic()), 3)
+    max_segundos = orcamento.get('max_segundos')
+    return {**orcamento, 'max_segundos': restante if max_segundos is None else min(max_segundos, restante)}
+
+def obter_orcamento(regra: Dict[str, Any], orcamento_tabela: Dict[str, float]) -> Dict[str, float]:
+    """
+    Combina o orçamento da regra com o saldo da tabela (ver iniciar_orcamento_tabela):
+    menor 'max_mb' e menor 'max_segundos', limitado ao tempo restante da tabela.
+    Retorna um dicionário vazio quando não há orçamento configurado.
+    """
+    orcamento_regra = regra.get('orcamento', {})
+
+    orcamento = {}
+    for chave in CHAVES_ORCAMENTO:
+        valores = [o[chave] for o in (orcamento_regra, orcamento_tabela) if o.get(chave) is not None]
+        if valores:
+            orcamento[chave] = min(valores)
+    return limitar_ao_prazo(orcamento, orcamento_tabela.get('prazo'))
+
+def _prazo_esgotado(orcamento: Dict[str, float], colunas: List[str]) -> Optional[Dict[str, Any]]:
+    if orcamento.get('max_segundos') is None or orcamento['max_segundos'] > 0:
+        return None
+    return {
+        "colunas_alvo": colunas,
+        "status": "ERRO",
+        "resumo_texto": "Prazo da tabela esgotado: regra não executada.",
+        "dados_resultado": {}
+    }
+
+def _memoria_virtual_atual() -> int:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+def obter_contexto_processos() -> multiprocessing.context.BaseContext:
+    """
+    Contexto de multiprocessamento seguro com threads ativas no processo
+    principal (prefetch de tabelas, diagnósticos em paralelo): 'forkserver',
+    ou 'spawn' onde não estiver disponível. Um fork direto copiaria locks
+    possivelmente retidos por essas threads e poderia travar o worker.
+    """
+    metodos = multiprocessing.get_all_start_methods()
+    if 'forkserver' not in metodos:
+        return multiprocessing.get_context('spawn')
+    contexto = multiprocessing.get_context('forkserver')
+    # Importados uma vez no servidor; cada worker já nasce com eles carregados
+    contexto.set_forkserver_preload(['numpy', 'pandas'])
+    return contexto
+
+def _aplicar_limite_memoria(max_mb: float) -> None:
+    # Limite relativo ao uso atual; sem a medição (ex: sem /proc, como no macOS)
+    # o limite absoluto seria arbitrário, então não é aplicado
+    memoria_atual = _memoria_virtual_atual()
+    if resource is None or memoria_atual == 0:
+        return
+    limite = memoria_atual + int(max_mb * 1024 * 1024)
+    _, limite_rigido = resource.getrlimit(resource.RLIMIT_AS)
+    if limite_rigido != resource.RLIM_INFINITY:
+        limite = min(limite, limite_rigido)
+    resource.setrlimit(resource.RLIMIT_AS, (limite, limite_rigido))
+
+def _executar_no_worker(emissor, funcao: Callable, df: pd.DataFrame, colunas: List[str],
+                        parametros: Dict[str, Any], max_mb: Optional[float]) -> None:
+    try:
+        if max_mb:
+            try:
+                _aplicar_limite_memoria(max_mb)
+            except (OSError, ValueError) as e:
+                # Falha ao configurar o limite não é estouro de memória da regra
+                emissor.send(("erro", f"Falha ao aplicar limite de memória ({e.__class__.__name__}): {e}"))
+                return
+        emissor.send(("ok", funcao(df, colunas, **parametros)))
+    except MemoryError:
+        emissor.send(("memoria", "MemoryError"))
+    except Exception as e:
+        emissor.send(("erro", f"{e.__class__.__name__}: {e}"))
+    finally:
+        emissor.close()
+
+def executar_com_orcamento(funcao: Callable, df: pd.DataFrame, colunas: List[str], parametros: Dict[str, Any],
+                           max_segundos: Optional[float] = None, max_mb: Optional[float] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Executa a análise em um processo supervisionado. Retorna (resultado, None)
+    em caso de sucesso ou (None, motivo) com motivo 'tempo' ou 'memoria'.
+    Exceções da própria análise são repassadas como RuntimeError.
+    """
+    # O DataFrame é serializado para o worker (ver obter_contexto_processos)
+    contexto = obter_contexto_processos()
+
+    receptor, emissor = contexto.Pipe(duplex=False)
+    processo = contexto.Process(
+        target=_executar_no_worker,
+        args=(emissor, funcao, df, colunas, parametros, max_mb),
+        daemon=True
+    )
+    processo.start()
+    emissor.close()
+
+    try:
+        if not receptor.poll(max_segundos):
+            processo.terminate()
+            return None, "tempo"
+        try:
+            situacao, carga = receptor.recv()
+        except EOFError:
+            # Worker encerrado sem resposta: SIGKILL indica o OOM killer do sistema;
+            # qualquer outra saída (ex: falha ao iniciar o worker) é um erro
+            processo.join(TIMEOUT_ENCERRAMENTO_SEGUNDOS)
+            if processo.exitcode == -getattr(signal, 'SIGKILL', 9):
+                return None, "memoria"
+            raise RuntimeError(f"Worker encerrado sem resposta (código de saída {processo.exitcode}).")
+    finally:
+        # Nunca bloqueia indefinidamente: escala terminate -> kill
+        processo.join(TIMEOUT_ENCERRAMENTO_SEGUNDOS)
+        if processo.is_alive():
+            processo.terminate()
+            processo.join(TIMEOUT_ENCERRAMENTO_SEGUNDOS)
+        if processo.is_alive():
+            processo.kill()
+            processo.join(TIMEOUT_ENCERRAMENTO_SEGUNDOS)
+        receptor.close()
+
+    if situacao == "ok":
+        return carga, None
+    if situacao == "memoria":
+        return None, "memoria"
+    raise RuntimeError(carga)
+
+def _preparar_fallback(funcao: Callable, df: pd.DataFrame, colunas: List[str], parametros: Dict[str, Any],
+                       fallback: Dict[str, Any]) -> Tuple[Callable, pd.DataFrame, List[str], Dict[str, Any], Dict[str, Any]]:
+    descricao = {}
+
+    if fallback.get('funcao_analise'):
+        funcao = getattr(importlib.import_module(funcao.__module__), fallback['funcao_analise'])
+        descricao['funcao_analise'] = fallback['funcao_analise']
+
+    amostra_linhas = fallback.get('amostra_linhas')
+    if amostra_linhas and len(df) > amostra_linhas:
+        df = df.sample(n=amostra_linhas, random_state=fallback.get('semente', 0))
+        descricao['amostra_linhas'] = amostra_linhas
+        # O índice ordenado compartilhado refere-se à tabela completa
+        parametros = {k: v for k, v in parametros.items() if k != 'indice_ordenado'}
+
+    max_colunas = fallback.get('max_colunas')
+    if max_colunas and len(colunas) > max_colunas:
+        descricao['colunas_descartadas'] = colunas[max_colunas:]
+        colunas = colunas[:max_colunas]
+
+    if fallback.get('parametros'):
+        parametros = {**parametros, **fallback['parametros']}
+        descricao['parametros'] = fallback['parametros']
+
+    return funcao, df, colunas, parametros, descricao
+
+def _projetar_colunas(df: pd.DataFrame, colunas: List[str], parametros: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    # Reduz o que é serializado para o worker às colunas alvo da regra
+    colunas_presentes = [col for col in colunas if col in df.columns]
+    if len(colunas_presentes) < len(df.columns):
+        df = df[colunas_presentes]
+    if parametros.get('indice_ordenado'):
+        parametros = {**parametros, 'indice_ordenado': {
+            col: valores for col, valores in parametros['indice_ordenado'].items() if col in colunas_presentes
+        }}
+    return df, parametros
+
+def executar_com_fallback(funcao: Callable, df: pd.DataFrame, colunas: List[str], parametros: Dict[str, Any],
+                          orcamento: Dict[str, float], fallback: Optional[Dict[str, Any]] = None,
+                          prazo: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Executa a análise sob o orçamento; se excedido, reexecuta a variante de
+    fallback e registra a degradação em resultado['fallback']. 'prazo' é o
+    prazo da tabela (ver iniciar_orcamento_tabela): o fallback recebe no
+    máximo o tempo que ainda resta até ele.
+    """
+    esgotado = _prazo_esgotado(orcamento, colunas)
+    if esgotado is not None:
+        return esgotado
+
+    df, parametros = _projetar_colunas(df, colunas, parametros)
+    resultado, motivo = executar_com_orcamento(funcao, df, colunas, parametros, **orcamento)
+    if motivo is None:
+        return resultado
+
+    rotulo_motivo = "tempo" if motivo == "tempo" else "memória"
+    if not fallback:
+        return {
+            "colunas_alvo": colunas,
+            "status": "ERRO",
+            "resumo_texto": f"Orçamento de {rotulo_motivo} excedido ({orcamento}) e nenhuma variante de fallback configurada.",
+            "dados_resultado": {}
+        }
+
+    print(f"   ! Orçamento de {rotulo_motivo} excedido ({orcamento}). Executando variante de fallback.")
+    orcamento_fb = limitar_ao_prazo(orcamento, prazo)
+    esgotado = _prazo_esgotado(orcamento_fb, colunas)
+    if esgotado is not None:
+        return esgotado
+    funcao_fb, df_fb, colunas_fb, parametros_fb, descricao = _preparar_fallback(funcao, df, colunas, parametros, fallback)
+    resultado, motivo_fb = executar_com_orcamento(funcao_fb, df_fb, colunas_fb, parametros_fb, **orcamento_fb)
+
+    if motivo_fb is not None:
+        return {
+            "colunas_alvo": colunas,
+            "status": "ERRO",
+            "resumo_texto": f"Orçamento excedido ({orcamento_fb}) também pela variante de fallback.",
+            "dados_resultado": {}
+        }
+
+    resultado['fallback'] = {"motivo": motivo, "orcamento": orcamento, "precisao": "REDUZIDA", **descricao}
+    resultado['resumo_texto'] = f"{resultado.get('resumo_texto', '')} [Precisão reduzida: fallback por {rotulo_motivo}.]"
+    return resultado
+
+# Instruções da VM do SQLite entre verificações do prazo
+INTERVALO_VERIFICACAO_SQL = 10000
+
+def executar_sql_com_orcamento(funcao_sql: Callable, conexao: sqlite3.Connection, origem: str, colunas: List[str],
+                               parametros: Dict[str, Any], orcamento: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Executa uma análise com pushdown SQL respeitando 'max_segundos': a consulta
+    em andamento é interrompida pelo progress handler quando o prazo expira.
+    """
+    if orcamento.get('max_mb') is not None:
+        print(f"   ! 'max_mb' não é aplicado no pushdown SQL (memória do SQLite). Ignorado ({orcamento}).")
+
+    esgotado = _prazo_esgotado(orcamento, colunas)
+    if esgotado is not None:
+        return esgotado
+
+    max_segundos = orcamento.get('max_segundos')
+    if max_segundos is None:
+        return funcao_sql(conexao, origem, colunas, **parametros)
+
+    prazo = time.monotonic() + max_segundos
+    estado = {"excedido": False}
+
+    def verificar_prazo() -> int:
+        # Valor diferente de zero interrompe a consulta (OperationalError)
+        estado["excedido"] = time.monotonic() > prazo
+        return int(estado["excedido"])
+
+    conexao.set_progress_handler(verificar_prazo, INTERVALO_VERIFICACAO_SQL)
+    try:
+        resultado = funcao_sql(conexao, origem, colunas, **parametros)
+    except sqlite3.OperationalError:
+        if not estado["excedido"]:
+            raise
+    finally:
+        conexao.set_progress_handler(None, 0)
+
+    if estado["excedido"]:
+        return {
+            "colunas_alvo": colunas,
+            "status": "ERRO",
+            "resumo_texto": f"Orçamento de tempo excedido ({orcamento}) no pushdown SQL. Variantes de fallback não se aplicam a consultas SQL.",
+            "dados_resultado": {}
+        }
+    return resultado
@@ -0,0 +1,237 @@
+# analises/particionado.py
+
+import os
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Tuple, Iterator
+
+from data_loader.loader import iterar_faixa_csv, iterar_parte_csv
+
+# ----------------------------------------------------------------------
+# ESTADOS MESCLÁVEIS PARA PROCESSAMENTO PARTICIONADO
+# ----------------------------------------------------------------------
+# Cada análise mesclável é descrita por três funções:
+#   estado(df, colunas, **parametros)   -> estado parcial de um bloco/faixa
+#   mesclar(estado_a, estado_b)         -> estado combinado
+#   finalizar(estado, colunas, **parametros) -> ResultadoAnalise padronizado
+#
+# Estratégia para regras sem forma mesclável direta:
+#   - validacao_chave_primaria: contagem de nulos é somada; a unicidade usa um
+#     "shuffle" por hash em duas passadas. Na primeira, cada worker grava o hash
+#     de 64 bits de cada valor da PK (nulos incluídos, como em duplicated) em
+#     arquivos de spill por bucket (hash % N_BUCKETS_PK). Na segunda, cada bucket
+#     é atribuído a um único worker (contar_duplicados_bucket), que lê apenas os
+#     seus arquivos e devolve só a contagem de duplicados. A memória por worker
+#     é proporcional ao tamanho de um bucket, e o processo principal recebe
+#     apenas inteiros. A contagem é exata a menos de colisões de hash de 64 bits.
+#   - Regras que dependem de quantis exatos ou de duas passadas (outliers IQR e
+#     Z-Score, correlação) não são executadas no modo particionado.
+
+N_BUCKETS_PK = 64
+
+# --- estatisticas_descritivas (count, mean, std, min, max) via Chan et al. ---
+
+def estado_descritivas(df: pd.DataFrame, colunas: List[str], **parametros: Any) -> Dict[str, Dict[str, float]]:
+    estado = {}
+    for col in colunas:
+        if col not in df.columns:
+            continue
+        serie = pd.to_numeric(df[col], errors='coerce').dropna()
+        n = int(serie.count())
+        if n == 0:
+            estado[col] = {"n": 0, "media": 0.0, "m2": 0.0, "min": np.inf, "max": -np.inf}
+            continue
+        media = float(serie.mean())
+        estado[col] = {
+            "n": n,
+            "media": media,
+            "m2": float(((serie - media) ** 2).sum()),
+            "min": float(serie.min()),
+            "max": float(serie.max())
+        }
+    return estado
+
+def mesclar_descritivas(estado_a: Dict[str, Dict[str, float]], estado_b: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    resultado = dict(estado_a)
+    for col, b in estado_b.items():
+        a = resultado.get(col)
+        if a is None or a["n"] == 0:
+            resultado[col] = b
+            continue
+        if b["n"] == 0:
+            continue
+        n = a["n"] + b["n"]
+        delta = b["media"] - a["media"]
+        resultado[col] = {
+            "n": n,
+            "media": a["media"] + delta * b["n"] / n,
+            "m2": a["m2"] + b["m2"] + delta ** 2 * a["n"] * b["n"] / n,
+            "min": min(a["min"], b["min"]),
+            "max": max(a["max"], b["max"])
+        }
+    return resultado
+
+def finalizar_descritivas(estado: Dict[str, Dict[str, float]], colunas: List[str], **parametros: Any) -> Dict[str, Any]:
+    arredondamento = parametros.get('arredondamento', 4)
+
+    if not estado:
+        return {
+            "colunas_alvo": colunas,
+            "status": "ERRO",
+            "resumo_texto": "Nenhuma coluna válida foi encontrada no DataFrame para análise estatística.",
+            "dados_resultado": {}
+        }
+
+    dados_resultado = {}
+    for col, e in estado.items():
+        if e["n"] == 0:
+            dados_resultado[col] = {"count": 0.0}
+            continue
+        std = float(np.sqrt(e["m2"] / (e["n"] - 1))) if e["n"] > 1 else float('nan')
+        dados_resultado[col] = {
+            "count": round(float(e["n"]), arredondamento),
+            "mean": round(e["media"], arredondamento),
+            "std": round(std, arredondamento),
+            "min": round(e["min"], arredondamento),
+            "max": round(e["max"], arredondamento)
+        }
+
+    return {
+        "colunas_alvo": list(estado.keys()),
+        "status": "SUCESSO",
+        "resumo_texto": f"Estatísticas descritivas (modo particionado, sem percentis) calculadas para {len(estado)} coluna(s) numérica(s).",
+        "dados_resultado": dados_resultado
+    }
+
+# --- validacao_chave_primaria via shuffle particionado por hash ---
+
+def estado_chave_primaria(df: pd.DataFrame, colunas: List[str], **parametros: Any) -> Dict[str, Any]:
+    pk_col = colunas[0]
+    serie = df[pk_col]
+    diretorio_spill = parametros['diretorio_spill']
+
+    hashes = pd.util.hash_pandas_object(serie, index=False).to_numpy()
+    buckets = hashes % np.uint64(N_BUCKETS_PK)
+    ordem = np.argsort(buckets, kind='stable')
+    hashes, buckets = hashes[ordem], buckets[ordem]
+    limites = np.searchsorted(buckets, np.arange(N_BUCKETS_PK + 1, dtype=np.uint64))
+
+    # Um arquivo por (bucket, processo): sem escrita concorrente no mesmo arquivo
+    for bucket in range(N_BUCKETS_PK):
+        inicio, fim = limites[bucket], limites[bucket + 1]
+        if fim > inicio:
+            caminho_spill = os.path.join(diretorio_spill, f"b{bucket:03d}_{os.getpid()}.bin")
+            with open(caminho_spill, 'ab') as f:
+                hashes[inicio:fim].tofile(f)
+
+    return {"total": len(serie), "nulos": int(serie.isnull().sum())}
+
+def mesclar_chave_primaria(estado_a: Dict[str, Any], estado_b: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "total": estado_a["total"] + estado_b["total"],
+        "nulos": estado_a["nulos"] + estado_b["nulos"]
+    }
+
+def contar_duplicados_bucket(diretorio_spill: str, bucket: int) -> int:
+    """
+    Segunda passada do shuffle: lê apenas os arquivos de spill do bucket e
+    conta as linhas cujo hash aparece mais de uma vez (equivalente a keep=False).
+    """
+    prefixo = f"b{bucket:03d}_"
+    partes = [
+        np.fromfile(os.path.join(diretorio_spill, nome), dtype=np.uint64)
+        for nome in os.listdir(diretorio_spill) if nome.startswith(prefixo)
+    ]
+    if not partes:
+        return 0
+    _, contagens = np.unique(np.concatenate(partes), return_counts=True)
+    return int(contagens[contagens > 1].sum())
+
+def finalizar_chave_primaria(estado: Dict[str, Any], colunas: List[str], **parametros: Any) -> Dict[str, Any]:
+    pk_col = colunas[0]
+    total_registros = estado["total"]
+    nulos_count = estado["nulos"]
+
+    if total_registros == 0:
+        return {
+            "colunas_alvo": colunas,
+            "status": "INFO",
+            "resumo_texto": "Tabela vazia. Nenhuma validação de PK aplicada.",
+            "dados_resultado": {"total_registros": 0}
+        }
+
+    # Preenchido pela segunda passada (contar_duplicados_bucket), somando os buckets
+    duplicados_count = estado["duplicados"]
+
+    if nulos_count > 0 or duplicados_count > 0:
+        status_final = "ALERTA"
+        resumo = f"Falha na integridade da PK '{pk_col}': {nulos_count} nulos e {duplicados_count} duplicados."
+    else:
+        status_final = "SUCESSO"
+        resumo = f"Chave primária '{pk_col}' validada com sucesso: 100% única e não nula."
+
+    return {
+        "colunas_alvo": colunas,
+        "status": status_final,
+        "resumo_texto": resumo,
+        "dados_resultado": {
+            "total_registros": total_registros,
+            "coluna_pk": pk_col,
+            "nulos_count": int(nulos_count),
+            "duplicados_count": duplicados_count,
+            "percentual_duplicados": (duplicados_count / total_registros) * 100,
+            "percentual_nulos": (nulos_count / total_registros) * 100
+        }
+    }
+
+# Registro: nome da função de análise -> (estado, mesclar, finalizar)
+ESTADOS_MESCLAVEIS = {
+    'estatisticas_descritivas': (estado_descritivas, mesclar_descritivas, finalizar_descritivas),
+    'validacao_chave_primaria': (estado_chave_primaria, mesclar_chave_primaria, finalizar_chave_primaria)
+}
+
+# Análises que gravam spill por bucket na primeira passada e precisam de uma
+# segunda passada por bucket: nome -> (chave do estado, função por bucket)
+SEGUNDA_PASSADA_BUCKETS = {
+    'validacao_chave_primaria': ('duplicados', contar_duplicados_bucket)
+}
+
+# ----------------------------------------------------------------------
+# WORKERS (FAIXA DE BYTES OU PARTE DE DIRETÓRIO)
+# ----------------------------------------------------------------------
+
+def _dtype_tarefas(tarefas: List[Tuple[str, List[str], Dict[str, Any]]]) -> Dict[str, str]:
+    # Colunas de PK são lidas como texto para que o hash seja estável entre blocos
+    dtype = {}
+    for funcao_analise, colunas, _ in tarefas:
+        if funcao_analise == 'validacao_chave_primaria' and colunas:
+            dtype[colunas[0]] = 'str'
+    return dtype
+
+def _acumular_estados(blocos: Iterator[pd.DataFrame], tarefas: List[Tuple[str, List[str], Dict[str, Any]]]) -> List[Any]:
+    estados = [None] * len(tarefas)
+    for df in blocos:
+        for i, (funcao_analise, colunas, parametros) in enumerate(tarefas):
+            estado_fn, mesclar_fn, _ = ESTADOS_MESCLAVEIS[funcao_analise]
+            parcial = estado_fn(df, colunas, **parametros)
+            estados[i] = parcial if estados[i] is None else mesclar_fn(estados[i], parcial)
+    return estados
+
+def processar_faixa_csv(caminho: str, inicio: int, fim: int, cabecalho: bytes, sep: str, encoding: str,
+                        tarefas: List[Tuple[str, List[str], Dict[str, Any]]]) -> List[Any]:
+    """
+    Executado em um processo separado: lê a faixa [inicio, fim) bloco a bloco e
+    acumula o estado mesclável de cada tarefa (funcao_analise, colunas, parametros).
+    Retorna a lista de estados parciais, na mesma ordem das tarefas.
+    """
+    dtype = _dtype_tarefas(tarefas)
+    return _acumular_estados(iterar_faixa_csv(caminho, inicio, fim, cabecalho, sep, encoding, dtype=dtype or None), tarefas)
+
+def processar_parte_csv(caminho: str, sep: str, encoding: str,
+                        tarefas: List[Tuple[str, List[str], Dict[str, Any]]]) -> List[Any]:
+    """
+    Igual a processar_faixa_csv, mas para uma parte inteira (possivelmente
+    comprimida) de uma tabela entregue como diretório/glob.
+    """
+    dtype = _dtype_tarefas(tarefas)
+    return _acumular_estados(iterar_parte_csv(caminho, sep, encoding, dtype=dtype or None), tarefas)
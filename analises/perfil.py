@@ -0,0 +1,106 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List
+
+from .base import estimar_distintos
+
+# ----------------------------------------------------------------------
+# PERFIL DA TABELA (todas as colunas, uma visita por coluna)
+# ----------------------------------------------------------------------
+
+# Resultados de pd.api.types.infer_dtype que indicam tipos misturados na coluna
+TIPOS_MISTOS = ('mixed', 'mixed-integer')
+
+def _perfil_coluna_tabela(serie: pd.Series, total_registros: int, distintos_exatos_ate: int) -> Dict[str, Any]:
+    # Máscara de validade única, reutilizada por todos os contadores da coluna
+    validos = serie.notna().to_numpy()
+    valores = serie[validos]
+    n_validos = len(valores)
+    nulos_count = total_registros - n_validos
+
+    perfil = {
+        "dtype": str(serie.dtype),
+        "tipo_inferido": pd.api.types.infer_dtype(valores, skipna=False) if n_validos else "vazio",
+        "nulos_count": int(nulos_count),
+        "percentual_nulos": (nulos_count / total_registros) * 100 if total_registros else 0.0,
+        "tipo_consistente": True
+    }
+    if n_validos == 0:
+        perfil["distintos_aprox"] = 0
+        return perfil
+
+    if perfil["tipo_inferido"] == "string" and not pd.api.types.is_bool_dtype(serie):
+        if n_validos <= distintos_exatos_ate:
+            # Uma única contagem por valor distinto fornece os distintos (exatos),
+            # os vazios e a proporção de valores que parecem numéricos
+            # (to_numeric aplicado só aos distintos, ponderado pelas contagens)
+            contagens = valores.value_counts(sort=False)
+            parecem_numericos = pd.to_numeric(contagens.index.to_series(), errors='coerce').notna().to_numpy()
+            numericos = int(contagens.to_numpy()[parecem_numericos].sum())
+            perfil["distintos_aprox"] = len(contagens)
+            perfil["vazios_count"] = int(contagens.get('', 0))
+        else:
+            # Acima do limite: HyperLogLog, sem tabela de distintos em memória
+            perfil["distintos_aprox"] = estimar_distintos(valores)
+            perfil["vazios_count"] = int(valores.eq('').sum())
+            numericos = int(pd.to_numeric(valores, errors='coerce').notna().sum())
+        perfil["percentual_numerico"] = (numericos / n_validos) * 100
+        perfil["tipo_consistente"] = numericos == 0 or numericos == n_validos
+        return perfil
+
+    perfil["distintos_aprox"] = int(valores.nunique()) if n_validos <= distintos_exatos_ate else estimar_distintos(valores)
+
+    if pd.api.types.is_bool_dtype(serie):
+        return perfil
+
+    if pd.api.types.is_numeric_dtype(serie):
+        array = serie.to_numpy()[validos]
+        perfil.update({
+            "min": float(array.min()),
+            "max": float(array.max()),
+            "zeros_count": int(np.count_nonzero(array == 0)),
+            "negativos_count": int(np.count_nonzero(array < 0))
+        })
+
+    elif pd.api.types.is_datetime64_any_dtype(serie):
+        perfil.update({"min": str(valores.min()), "max": str(valores.max())})
+
+    elif perfil["tipo_inferido"] in TIPOS_MISTOS:
+        perfil["tipo_consistente"] = False
+
+    return perfil
+
+def perfil_tabela(df: pd.DataFrame, colunas: List[str], **parametros: Any) -> Dict[str, Any]:
+    """
+    Perfil de todas as colunas alvo em uma única visita por coluna: nulos (pela
+    máscara de validade), distintos (exato até 'distintos_exatos_ate', HyperLogLog
+    acima), min/max, zeros/negativos, strings vazias e consistência de tipo.
+    """
+    distintos_exatos_ate = parametros.get('distintos_exatos_ate', 100000)
+
+    colunas_validas = [col for col in colunas if col in df.columns]
+
+    if not colunas_validas:
+        return {
+            "colunas_alvo": colunas,
+            "status": "ERRO",
+            "resumo_texto": "Nenhuma coluna válida foi encontrada no DataFrame para o perfil da tabela.",
+            "dados_resultado": {}
+        }
+
+    total_registros = len(df)
+    dados_resultado = {
+        col: _perfil_coluna_tabela(df[col], total_registros, distintos_exatos_ate)
+        for col in colunas_validas
+    }
+
+    colunas_inconsistentes = sum(1 for perfil in dados_resultado.values() if not perfil["tipo_consistente"])
+    status_final = "ALERTA" if colunas_inconsistentes > 0 else "SUCESSO"
+    resumo = f"Perfil calculado para {len(colunas_validas)} coluna(s). {colunas_inconsistentes} com tipos misturados."
+
+    return {
+        "colunas_alvo": colunas_validas,
+        "status": status_final,
+        "resumo_texto": resumo,
+        "dados_resultado": dados_resultado
+    }
@@ -0,0 +1,190 @@
+# analises/pushdown_sql.py
+
+import math
+import sqlite3
+from typing import Dict, Any, List
+
+from data_loader.loader import citar_identificador_sql, TAMANHO_LOTE_SQLITE
+
+# ----------------------------------------------------------------------
+# PUSHDOWN DE AGREGAÇÕES PARA FONTES SQLITE
+# ----------------------------------------------------------------------
+# Versões das análises que executam os agregados no próprio SQLite, sem trazer
+# a tabela para o pandas. Recebem a conexão e a 'origem' (a consulta da fonte,
+# usada como subconsulta) e retornam o mesmo ResultadoAnalise padronizado.
+# Análises sem versão aqui fazem a busca completa via load_data (fetchmany).
+
+def _colunas_existentes(conexao: sqlite3.Connection, origem: str) -> List[str]:
+    cursor = conexao.execute(f"SELECT * FROM ({origem}) LIMIT 0")
+    return [descricao[0] for descricao in cursor.description]
+
+def validacao_chave_primaria_sql(conexao: sqlite3.Connection, origem: str, colunas: List[str], **parametros: Any) -> Dict[str, Any]:
+    """
+    Validação de unicidade e nulidade da PK via COUNT e GROUP BY/HAVING.
+    Assim como duplicated(keep=False), conta todas as linhas com valor repetido
+    (nulos repetidos incluídos).
+    """
+    if not colunas:
+        return {
+            "colunas_alvo": [],
+            "status": "ERRO",
+            "resumo_texto": "Nenhuma coluna de chave primária fornecida para validação.",
+            "dados_resultado": {}
+        }
+
+    pk_col = colunas[0]
+    # SQLite lê um identificador desconhecido entre aspas duplas como literal de
+    # texto: sem esta checagem, uma coluna inexistente viraria "100% duplicados"
+    if pk_col not in _colunas_existentes(conexao, origem):
+        return {
+            "colunas_alvo": colunas,
+            "status": "ERRO",
+            "resumo_texto": f"Coluna de chave primária '{pk_col}' não encontrada na fonte SQL.",
+            "dados_resultado": {}
+        }
+
+    pk_sql = citar_identificador_sql(pk_col)
+
+    total_registros, nulos_count = conexao.execute(
+        f"SELECT COUNT(*), COALESCE(SUM({pk_sql} IS NULL), 0) FROM ({origem})"
+    ).fetchone()
+
+    if total_registros == 0:
+        return {
+            "colunas_alvo": colunas,
+            "status": "INFO",
+            "resumo_texto": "Tabela vazia. Nenhuma validação de PK aplicada.",
+            "dados_resultado": {"total_registros": 0}
+        }
+
+    (duplicados_count,) = conexao.execute(
+        f"SELECT COALESCE(SUM(n), 0) FROM (SELECT COUNT(*) AS n FROM ({origem}) GROUP BY {pk_sql} HAVING COUNT(*) > 1)"
+    ).fetchone()
+
+    if nulos_count > 0 or duplicados_count > 0:
+        status_final = "ALERTA"
+        resumo = f"Falha na integridade da PK '{pk_col}': {nulos_count} nulos e {duplicados_count} duplicados."
+    else:
+        status_final = "SUCESSO"
+        resumo = f"Chave primária '{pk_col}' validada com sucesso: 100% única e não nula."
+
+    return {
+        "colunas_alvo": colunas,
+        "status": status_final,
+        "resumo_texto": resumo,
+        "dados_resultado": {
+            "total_registros": total_registros,
+            "coluna_pk": pk_col,
+            "nulos_count": int(nulos_count),
+            "duplicados_count": int(duplicados_count),
+            "percentual_duplicados": (duplicados_count / total_registros) * 100,
+            "percentual_nulos": (nulos_count / total_registros) * 100
+        }
+    }
+
+def _percentis_ordenados(conexao: sqlite3.Connection, origem: str, col_sql: str, count: int,
+                         percentis: List[float]) -> Dict[str, float]:
+    """
+    Percentis (interpolação linear, como no pandas) em uma única varredura
+    ordenada da coluna, lida em lotes até a maior posição necessária.
+    """
+    posicoes = {p: (count - 1) * p for p in percentis}
+    necessarias = set()
+    for posicao in posicoes.values():
+        inferior = math.floor(posicao)
+        necessarias.update((inferior, min(inferior + 1, count - 1)))
+    ultima = max(necessarias)
+
+    valores = {}
+    cursor = conexao.execute(f"SELECT {col_sql} FROM ({origem}) WHERE {col_sql} IS NOT NULL ORDER BY {col_sql}")
+    try:
+        deslocamento = 0
+        while deslocamento <= ultima:
+            lote = cursor.fetchmany(TAMANHO_LOTE_SQLITE)
+            if not lote:
+                break
+            for k in necessarias:
+                if deslocamento <= k < deslocamento + len(lote):
+                    valores[k] = lote[k - deslocamento][0]
+            deslocamento += len(lote)
+    finally:
+        cursor.close()
+
+    resultado = {}
+    for p, posicao in posicoes.items():
+        inferior = math.floor(posicao)
+        base = valores[inferior]
+        superior = valores[min(inferior + 1, count - 1)]
+        resultado[f"{p * 100:g}%"] = base + (superior - base) * (posicao - inferior)
+    return resultado
+
+def estatisticas_descritivas_sql(conexao: sqlite3.Connection, origem: str, colunas: List[str], **parametros: Any) -> Dict[str, Any]:
+    """
+    Estatísticas descritivas via agregados SQL: COUNT/AVG/MIN/MAX e soma dos
+    quadrados de todas as colunas em uma única consulta agregada, e percentis
+    em uma varredura ordenada por coluna.
+    """
+    percentis_padrao = parametros.get('percentis', [0.25, 0.5, 0.75])
+    arredondamento = parametros.get('arredondamento', 4)
+
+    existentes = set(_colunas_existentes(conexao, origem))
+    colunas_validas = [col for col in colunas if col in existentes]
+
+    if not colunas_validas:
+        return {
+            "colunas_alvo": colunas,
+            "status": "ERRO",
+            "resumo_texto": f"Nenhuma coluna válida foi encontrada no DataFrame para análise estatística.",
+            "dados_resultado": {}
+        }
+
+    try:
+        # Soma dos quadrados com dados deslocados (primeiro valor não nulo de cada
+        # coluna), estável numericamente e calculável na mesma varredura
+        expressoes = []
+        for col in colunas_validas:
+            col_sql = citar_identificador_sql(col)
+            deslocamento = f"(SELECT {col_sql} FROM ({origem}) WHERE {col_sql} IS NOT NULL LIMIT 1)"
+            expressoes.append(
+                f"COUNT({col_sql}), AVG({col_sql}), MIN({col_sql}), MAX({col_sql}), "
+                f"SUM({col_sql} - {deslocamento}), SUM(({col_sql} - {deslocamento}) * ({col_sql} - {deslocamento}))"
+            )
+        agregados = conexao.execute(f"SELECT {', '.join(expressoes)} FROM ({origem})").fetchone()
+
+        dados_resultado = {}
+        for i, col in enumerate(colunas_validas):
+            count, mean, minimo, maximo, soma_desl, soma_quadrados_desl = agregados[6 * i:6 * i + 6]
+
+            if count == 0:
+                dados_resultado[col] = {"count": 0.0}
+                continue
+
+            soma_quadrados = soma_quadrados_desl - soma_desl * soma_desl / count
+            std = math.sqrt(max(soma_quadrados, 0.0) / (count - 1)) if count > 1 else float('nan')
+
+            stats = {"count": float(count), "mean": mean, "std": std, "min": minimo}
+            stats.update(_percentis_ordenados(conexao, origem, citar_identificador_sql(col), count, percentis_padrao))
+            stats["max"] = maximo
+
+            dados_resultado[col] = {k: round(float(v), arredondamento) for k, v in stats.items()}
+
+        status_final = "SUCESSO"
+        resumo = f"Estatísticas descritivas calculadas para {len(colunas_validas)} coluna(s) numérica(s) (pushdown SQL)."
+
+    except Exception as e:
+        status_final = "ERRO"
+        resumo = f"Erro ao calcular estatísticas descritivas: {e}"
+        dados_resultado = {}
+
+    return {
+        "colunas_alvo": colunas_validas,
+        "status": status_final,
+        "resumo_texto": resumo,
+        "dados_resultado": dados_resultado
+    }
+
+# Registro: nome da função de análise -> versão com pushdown SQL
+PUSHDOWN_SQL = {
+    'validacao_chave_primaria': validacao_chave_primaria_sql,
+    'estatisticas_descritivas': estatisticas_descritivas_sql
+}
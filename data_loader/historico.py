@@ -0,0 +1,97 @@
+# data_loader/historico.py
+
+import json
+import sqlite3
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+
+# ----------------------------------------------------------------------
+# HISTÓRICO DE PERFIS POR EXECUÇÃO (SQLite local)
+# ----------------------------------------------------------------------
+# Cada execução grava um perfil compacto por coluna (momentos, sketch de
+# quantis, histograma, taxa de nulos, distintos), indexado por
+# (tabela, coluna, id_execucao). Comparações entre execuções leem apenas
+# esses perfis, sem reler os dados brutos.
+
+CAMINHO_HISTORICO_PADRAO = 'historico_eda.db'
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS perfis_coluna (
+    tabela TEXT NOT NULL,
+    coluna TEXT NOT NULL,
+    id_execucao TEXT NOT NULL,
+    perfil TEXT NOT NULL,
+    PRIMARY KEY (tabela, coluna, id_execucao)
+)
+"""
+
+def gerar_id_execucao() -> str:
+    """
+    Id único de execução, ordenável cronologicamente: timestamp ISO em UTC
+    (sem saltos de horário de verão) com microssegundos, seguido de um sufixo
+    aleatório (desempate entre execuções iniciadas no mesmo instante).
+    """
+    return f"{datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')}-{uuid.uuid4().hex[:8]}"
+
+def _conectar(caminho: str) -> sqlite3.Connection:
+    conexao = sqlite3.connect(caminho)
+    conexao.execute(_DDL)
+    return conexao
+
+def salvar_perfis(caminho: str, tabela: str, id_execucao: str, perfis: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Grava (ou substitui) os perfis das colunas de uma tabela para a execução.
+    """
+    conexao = _conectar(caminho)
+    try:
+        with conexao:
+            conexao.executemany(
+                "INSERT OR REPLACE INTO perfis_coluna (tabela, coluna, id_execucao, perfil) VALUES (?, ?, ?, ?)",
+                [(tabela, coluna, id_execucao, json.dumps(perfil)) for coluna, perfil in perfis.items()]
+            )
+    finally:
+        conexao.close()
+
+def carregar_perfil(caminho: str, tabela: str, coluna: str, id_execucao: Optional[str] = None,
+                    antes_de: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Retorna o perfil de uma coluna: o da execução 'id_execucao', se informado,
+    ou o mais recente anterior a 'antes_de' (ou o mais recente de todos).
+    O id_execucao encontrado é devolvido na chave 'id_execucao'.
+    """
+    consulta = "SELECT id_execucao, perfil FROM perfis_coluna WHERE tabela = ? AND coluna = ?"
+    argumentos: List[Any] = [tabela, coluna]
+    if id_execucao is not None:
+        consulta += " AND id_execucao = ?"
+        argumentos.append(id_execucao)
+    elif antes_de is not None:
+        consulta += " AND id_execucao < ?"
+        argumentos.append(antes_de)
+    consulta += " ORDER BY id_execucao DESC LIMIT 1"
+
+    conexao = _conectar(caminho)
+    try:
+        linha = conexao.execute(consulta, argumentos).fetchone()
+    finally:
+        conexao.close()
+
+    if linha is None:
+        return None
+    perfil = json.loads(linha[1])
+    perfil['id_execucao'] = linha[0]
+    return perfil
+
+def listar_execucoes(caminho: str, tabela: str, coluna: str) -> List[str]:
+    """
+    Lista os ids de execução com perfil gravado para a coluna, em ordem cronológica.
+    """
+    conexao = _conectar(caminho)
+    try:
+        linhas = conexao.execute(
+            "SELECT id_execucao FROM perfis_coluna WHERE tabela = ? AND coluna = ? ORDER BY id_execucao",
+            (tabela, coluna)
+        ).fetchall()
+    finally:
+        conexao.close()
+    return [linha[0] for linha in linhas]
@@ -2,44 +2,291 @@
 
 import pandas as pd
 import os
-from typing import Union
+import io
+import csv
+import glob
+import gzip
+import bz2
+import zipfile
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Tuple, List, Iterator, Optional, Dict, BinaryIO
 
-def load_data(caminho: str, tipo: str) -> pd.DataFrame:
+TAMANHO_LOTE_SQLITE = 50000
+MAX_WORKERS_LEITURA = 4
+EXTENSOES_COMPRIMIDAS = ('.gz', '.bz2', '.zip', '.zst')
+
+def load_data(caminho: str, tipo: str, consulta: Optional[str] = None) -> pd.DataFrame:
     """
     Carrega um DataFrame com base no caminho e tipo de arquivo.
+    Para 'sqlite', 'consulta' é o SELECT a executar (ver montar_consulta_sqlite).
+    O caminho pode ser um diretório ou um padrão glob (partes concatenadas, lidas
+    em paralelo) e os arquivos podem estar comprimidos (.gz, .bz2, .zip, .zst).
+    Não imprime nada: a carga pode ocorrer na thread de prefetch, então quem
+    consome o DataFrame é que reporta a contagem de linhas e os avisos de carga,
+    anexados em df.attrs['avisos_carga'] (ver executar_analise).
     """
     
-    if not os.path.exists(caminho):
+    partes = listar_partes(caminho)
+    if not partes:
         raise FileNotFoundError(f"Arquivo de dados não encontrado no caminho: {caminho}")
 
     df: Union[pd.DataFrame, None] = None
+    avisos: List[str] = []
     tipo_normalizado = tipo.lower().strip()
 
     try:
-        if tipo_normalizado == 'csv':
+        if len(partes) > 1 and tipo_normalizado in ('csv', 'excel'):
+            df = ler_partes(partes, tipo_normalizado)
+
+        elif tipo_normalizado == 'csv':
+            caminho = partes[0]
             # Tenta UTF-8 e, em caso de falha de decodificação, tenta CP1252
             try:
                 df = pd.read_csv(caminho, sep=None, engine='python', encoding='utf-8')
             except UnicodeDecodeError:
-                print(f"   --> Aviso: UTF-8 falhou. Tentando 'cp1252' para {caminho}")
+                avisos.append(f"UTF-8 falhou. Usado 'cp1252' para {caminho}")
                 df = pd.read_csv(caminho, sep=None, engine='python', encoding='cp1252')
             
-            print(f"   --> Carregado CSV de {len(df)} linhas.")
-            
         elif tipo_normalizado == 'excel':
-            df = pd.read_excel(caminho)
-            print(f"   --> Carregado Excel de {len(df)} linhas.")
+            df = pd.read_excel(partes[0])
+
+        elif tipo_normalizado == 'sqlite':
+            if not consulta:
+                raise ValueError("Fonte 'sqlite' requer 'tabela_sql' ou 'consulta_sql' na metatabela.")
+            df = carregar_sqlite(caminho, consulta)
             
         else:
-            raise ValueError(f"Tipo de arquivo não suportado: '{tipo}'. Suportados: 'csv', 'excel'.")
+            raise ValueError(f"Tipo de arquivo não suportado: '{tipo}'. Suportados: 'csv', 'excel', 'sqlite'.")
 
         if df is None:
             raise Exception("DataFrame não foi carregado corretamente.")
-            
+
+        if avisos:
+            df.attrs['avisos_carga'] = avisos
         return df
 
     except ValueError as e:
         raise ValueError(f"Erro ao carregar {caminho} ({tipo}): {e}")
     
     except Exception as e:
-        raise Exception(f"Erro de leitura inesperado em {caminho}: {e}")
\ No newline at end of file
+        raise Exception(f"Erro de leitura inesperado em {caminho}: {e}")
+
+# ----------------------------------------------------------------------
+# DIRETÓRIOS/GLOB PARTICIONADOS E ARQUIVOS COMPRIMIDOS
+# ----------------------------------------------------------------------
+
+def _e_parte_de_dados(caminho: str) -> bool:
+    # Ignora ocultos, marcadores de jobs (_SUCCESS, _committed_*, ...) e arquivos vazios
+    nome = os.path.basename(caminho)
+    return (not nome.startswith(('.', '_')) and os.path.isfile(caminho)
+            and os.path.getsize(caminho) > 0)
+
+def listar_partes(caminho: str) -> List[str]:
+    """
+    Resolve o caminho em uma lista ordenada de arquivos: os arquivos de dados
+    de um diretório, os que casam com um padrão glob, ou o próprio arquivo.
+    Em diretórios e globs, arquivos ocultos, iniciados por '_' (marcadores como
+    _SUCCESS) e vazios são ignorados.
+    """
+    if os.path.isdir(caminho):
+        return sorted(
+            parte for parte in (os.path.join(caminho, nome) for nome in os.listdir(caminho))
+            if _e_parte_de_dados(parte)
+        )
+    if glob.has_magic(caminho):
+        return sorted(parte for parte in glob.glob(caminho) if _e_parte_de_dados(parte))
+    return [caminho] if os.path.exists(caminho) else []
+
+def abrir_descomprimido(caminho: str) -> BinaryIO:
+    """
+    Abre o arquivo em modo binário, descomprimindo em fluxo conforme a extensão
+    (.gz, .bz2, .zip com um único arquivo, .zst). Nada é gravado em disco.
+    """
+    caminho_minusculo = caminho.lower()
+    if caminho_minusculo.endswith('.gz'):
+        return gzip.open(caminho, 'rb')
+    if caminho_minusculo.endswith('.bz2'):
+        return bz2.open(caminho, 'rb')
+    if caminho_minusculo.endswith('.zip'):
+        arquivo_zip = zipfile.ZipFile(caminho)
+        membros = [membro for membro in arquivo_zip.namelist() if not membro.endswith('/')]
+        if len(membros) != 1:
+            raise ValueError(f"Arquivo zip deve conter exatamente um arquivo de dados: {caminho}")
+        return arquivo_zip.open(membros[0])
+    if caminho_minusculo.endswith('.zst'):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Leitura de arquivos .zst requer o pacote 'zstandard' (pip install zstandard).")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(caminho, 'rb'), closefd=True))
+    return open(caminho, 'rb')
+
+def ler_cabecalho(caminho: str) -> bytes:
+    """
+    Lê apenas a primeira linha (já descomprimida) do arquivo.
+    """
+    with abrir_descomprimido(caminho) as f:
+        return f.readline()
+
+def _ler_parte_csv(caminho: str, sep: str, encoding: str) -> pd.DataFrame:
+    with abrir_descomprimido(caminho) as f:
+        try:
+            return pd.read_csv(f, sep=sep, encoding=encoding)
+        except UnicodeDecodeError:
+            pass
+    with abrir_descomprimido(caminho) as f:
+        return pd.read_csv(f, sep=sep, encoding='cp1252')
+
+def ler_partes(partes: List[str], tipo: str, max_workers: int = MAX_WORKERS_LEITURA) -> pd.DataFrame:
+    """
+    Lê e descomprime as partes em paralelo (pool de threads limitado) e
+    concatena o resultado em um único DataFrame. Para CSV, o separador e o
+    encoding são detectados uma única vez, no cabeçalho da primeira parte.
+    """
+    if tipo == 'csv':
+        sep, encoding = detectar_formato_csv(ler_cabecalho(partes[0]))
+        ler_parte = lambda parte: _ler_parte_csv(parte, sep, encoding)
+    else:
+        ler_parte = pd.read_excel
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(partes))) as executor:
+        frames = list(executor.map(ler_parte, partes))
+
+    return pd.concat(frames, ignore_index=True)
+
+def iterar_parte_csv(caminho: str, sep: str, encoding: str, dtype: Optional[Dict[str, str]] = None,
+                     linhas_bloco: int = 500000) -> Iterator[pd.DataFrame]:
+    """
+    Lê uma parte (possivelmente comprimida) em blocos de 'linhas_bloco' linhas,
+    para o caminho de análise por estados mescláveis.
+    """
+    with abrir_descomprimido(caminho) as f:
+        for df in pd.read_csv(f, sep=sep, encoding=encoding, dtype=dtype, chunksize=linhas_bloco):
+            yield df
+
+# ----------------------------------------------------------------------
+# FONTE SQLITE
+# ----------------------------------------------------------------------
+
+def citar_identificador_sql(nome: str) -> str:
+    """
+    Cita um identificador SQL (tabela/coluna) com aspas duplas.
+    """
+    return '"' + nome.replace('"', '""') + '"'
+
+def montar_consulta_sqlite(meta_tabela: Dict) -> Optional[str]:
+    """
+    Monta o SELECT da fonte SQLite a partir da metatabela: 'consulta_sql' tem
+    prioridade; caso contrário, lê toda a 'tabela_sql'.
+    """
+    if meta_tabela.get('consulta_sql'):
+        return meta_tabela['consulta_sql']
+    if meta_tabela.get('tabela_sql'):
+        return f"SELECT * FROM {citar_identificador_sql(meta_tabela['tabela_sql'])}"
+    return None
+
+def carregar_sqlite(caminho: str, consulta: str, tamanho_lote: int = TAMANHO_LOTE_SQLITE) -> pd.DataFrame:
+    """
+    Executa a consulta e busca as linhas em lotes com fetchmany, montando o
+    DataFrame a partir dos lotes.
+    """
+    conexao = sqlite3.connect(caminho)
+    try:
+        cursor = conexao.execute(consulta)
+        colunas = [descricao[0] for descricao in cursor.description]
+        lotes = []
+        while True:
+            linhas = cursor.fetchmany(tamanho_lote)
+            if not linhas:
+                break
+            lotes.append(pd.DataFrame.from_records(linhas, columns=colunas))
+    finally:
+        conexao.close()
+
+    if not lotes:
+        return pd.DataFrame(columns=colunas)
+    return pd.concat(lotes, ignore_index=True)
+
+# ----------------------------------------------------------------------
+# LEITURA PARTICIONADA (faixas de bytes alinhadas a quebras de linha)
+# ----------------------------------------------------------------------
+# Limitação: campos entre aspas contendo quebras de linha não são suportados,
+# pois os limites das faixas são alinhados ao próximo '\n'.
+
+TAMANHO_BLOCO_PADRAO = 64 * 1024 * 1024
+
+def detectar_formato_csv(cabecalho: bytes) -> Tuple[str, str]:
+    """
+    Detecta o encoding (UTF-8 com fallback para CP1252) e o separador a partir
+    da linha de cabeçalho, lida uma única vez.
+    """
+    try:
+        texto = cabecalho.decode('utf-8')
+        encoding = 'utf-8'
+    except UnicodeDecodeError:
+        texto = cabecalho.decode('cp1252')
+        encoding = 'cp1252'
+
+    try:
+        sep = csv.Sniffer().sniff(texto, delimiters=',;\t|').delimiter
+    except csv.Error:
+        sep = ','
+    return sep, encoding
+
+def colunas_cabecalho(cabecalho: bytes, sep: str, encoding: str) -> List[str]:
+    """
+    Nomes das colunas a partir da linha de cabeçalho (respeitando aspas).
+    """
+    linha = cabecalho.decode(encoding).lstrip('\ufeff').rstrip('\r\n')
+    return next(csv.reader([linha], delimiter=sep), [])
+
+def particionar_csv(caminho: str, n_particoes: int) -> Tuple[bytes, List[Tuple[int, int]]]:
+    """
+    Divide um CSV em até 'n_particoes' faixas de bytes [inicio, fim) alinhadas
+    ao início de uma linha. O cabeçalho é lido uma única vez e retornado à parte.
+    """
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(f"Arquivo de dados não encontrado no caminho: {caminho}")
+
+    tamanho = os.path.getsize(caminho)
+    with open(caminho, 'rb') as f:
+        cabecalho = f.readline()
+        inicio_dados = f.tell()
+        passo = max(1, (tamanho - inicio_dados) // max(1, n_particoes))
+
+        limites = [inicio_dados]
+        for i in range(1, n_particoes):
+            f.seek(inicio_dados + i * passo)
+            f.readline()  # Avança até o fim da linha corrente
+            posicao = f.tell()
+            if posicao >= tamanho:
+                break
+            if posicao > limites[-1]:
+                limites.append(posicao)
+        limites.append(tamanho)
+
+    faixas = [(inicio, fim) for inicio, fim in zip(limites[:-1], limites[1:]) if fim > inicio]
+    return cabecalho, faixas
+
+def iterar_faixa_csv(caminho: str, inicio: int, fim: int, cabecalho: bytes, sep: str, encoding: str,
+                     dtype: Optional[Dict[str, str]] = None, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[pd.DataFrame]:
+    """
+    Lê a faixa [inicio, fim) em blocos de aproximadamente 'tamanho_bloco' bytes,
+    sempre completando a última linha, e retorna cada bloco como DataFrame
+    (o cabeçalho é reaplicado a cada bloco).
+    """
+    with open(caminho, 'rb') as f:
+        f.seek(inicio)
+        while f.tell() < fim:
+            restante = fim - f.tell()
+            bloco = f.read(min(tamanho_bloco, restante))
+            if f.tell() < fim and not bloco.endswith(b'\n'):
+                bloco += f.readline()
+            if not bloco.strip():
+                continue
+            try:
+                df = pd.read_csv(io.BytesIO(cabecalho + bloco), sep=sep, encoding=encoding, dtype=dtype)
+            except UnicodeDecodeError:
+                df = pd.read_csv(io.BytesIO(cabecalho + bloco), sep=sep, encoding='cp1252', dtype=dtype)
+            yield df
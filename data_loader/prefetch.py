@@ -0,0 +1,78 @@
+# data_loader/prefetch.py
+
+import queue
+import threading
+import pandas as pd
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+# ----------------------------------------------------------------------
+# PREFETCH DE TABELAS (thread de carga + fila limitada)
+# ----------------------------------------------------------------------
+# Enquanto o consumidor analisa a tabela i, uma thread em segundo plano já
+# carrega as próximas (até 'profundidade' na fila). Back-pressure por memória:
+# a thread só inicia uma nova carga se os DataFrames ainda não liberados pelo
+# consumidor somarem menos que 'limite_memoria_mb'.
+
+_FIM = object()
+
+def _tamanho_bytes(dado: Any) -> int:
+    if isinstance(dado, pd.DataFrame):
+        # deep=True: conta o conteúdo das strings (colunas object), não só os ponteiros
+        return int(dado.memory_usage(index=True, deep=True).sum())
+    return 0
+
+def iterar_com_prefetch(itens: Iterable[Any], carregar: Callable[[Any], Any], profundidade: int = 1,
+                        limite_memoria_mb: Optional[float] = None) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """
+    Gera (item, dado, erro) na ordem de 'itens', onde 'dado' é o retorno de
+    carregar(item) e 'erro' a exceção levantada na carga (ou None).
+    Com profundidade <= 0 a carga é sequencial, sem thread.
+    """
+    if profundidade <= 0:
+        for item in itens:
+            try:
+                yield item, carregar(item), None
+            except Exception as e:
+                yield item, None, e
+        return
+
+    fila = queue.Queue(maxsize=profundidade)
+    condicao = threading.Condition()
+    estado = {"bytes_em_uso": 0, "cancelado": False}
+    limite_bytes = limite_memoria_mb * 1024 * 1024 if limite_memoria_mb else None
+
+    def produtor():
+        for item in itens:
+            with condicao:
+                while limite_bytes is not None and estado["bytes_em_uso"] >= limite_bytes and not estado["cancelado"]:
+                    condicao.wait()
+                if estado["cancelado"]:
+                    return
+            try:
+                dado, erro = carregar(item), None
+            except Exception as e:
+                dado, erro = None, e
+            tamanho = _tamanho_bytes(dado)
+            with condicao:
+                estado["bytes_em_uso"] += tamanho
+            fila.put((item, dado, erro, tamanho))
+        fila.put(_FIM)
+
+    thread = threading.Thread(target=produtor, name="prefetch_tabelas", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            entrada = fila.get()
+            if entrada is _FIM:
+                break
+            item, dado, erro, tamanho = entrada
+            yield item, dado, erro
+            # O consumidor terminou o item: libera sua memória para novas cargas
+            with condicao:
+                estado["bytes_em_uso"] -= tamanho
+                condicao.notify_all()
+    finally:
+        with condicao:
+            estado["cancelado"] = True
+            condicao.notify_all()
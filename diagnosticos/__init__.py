@@ -5,19 +5,27 @@
 
 from .integridade_diag import diagnostico_chave_primaria
 from .numericas_diag import (
-    diagnostico_estatistico,
     diagnostico_outliers_iqr,
     diagnostico_outliers_zscore,
     diagnostico_correlacao
 )
+from .drift_diag import diagnostico_drift
+from .perfil_diag import diagnostico_perfil_tabela
+from .motor_regras import achatar_resultados, compilar_regras, avaliar_regras, diagnostico_por_regras
 
 # Você pode adicionar as funções de outros módulos aqui conforme você as cria
 # Ex: from .categorico_diag import diagnostico_contagem
 
 __all__ = [
     'diagnostico_chave_primaria',
-    'diagnostico_estatistico',
     'diagnostico_outliers_iqr',
     'diagnostico_outliers_zscore',
-    'diagnostico_correlacao'
+    'diagnostico_correlacao',
+    'diagnostico_drift',
+    'diagnostico_perfil_tabela',
+    # Motor de regras declarativas
+    'achatar_resultados',
+    'compilar_regras',
+    'avaliar_regras',
+    'diagnostico_por_regras'
 ]
\ No newline at end of file
@@ -0,0 +1,43 @@
+# diagnosticos/drift_diag.py
+
+from typing import Dict, Any, List
+# Importa a função base para a criação do registro
+from .base_diagnosticos import criar_registro_diagnostico
+
+# ----------------------------------------------------------------------
+# Função de Diagnóstico: analise_de_drift
+# ----------------------------------------------------------------------
+
+def diagnostico_drift(resultado_analise: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Interpreta o resultado da análise de drift (PSI/KS contra o histórico)
+    para emitir alertas de mudança de distribuição entre execuções.
+    """
+    diagnosticos = []
+    tabela = resultado_analise.get('tabela', 'N/A')
+    dados = resultado_analise['dados_resultado']
+    origem = resultado_analise['tipo_analise']
+
+    for coluna, stats in dados.items():
+        if 'psi' not in stats:
+            continue
+
+        psi = stats['psi']
+        ks = stats['ks']
+        if psi < stats.get('limite_psi', 0.25) and ks < stats.get('limite_ks', 0.1):
+            continue
+
+        diagnosticos.append(criar_registro_diagnostico(
+            id_diag="DRIFT_DIST_001",
+            tabela=tabela,
+            coluna=coluna,
+            origem=origem,
+            severidade="ALERTA",
+            categoria="DISTRIBUIÇÃO",
+            mensagem="Mudança de distribuição em relação à execução anterior.",
+            detalhe=f"PSI={psi:.4f}, KS={ks:.4f} contra a execução '{stats.get('id_execucao_referencia')}'. Média {stats.get('mean_referencia'):.2f} -> {stats.get('mean_atual'):.2f}.",
+            recomendacao="Verificar mudanças na origem/ETL dos dados e reavaliar modelos treinados com a distribuição anterior.",
+            evidencia={"psi": psi, "ks": ks, "id_execucao_referencia": stats.get('id_execucao_referencia')}
+        ))
+
+    return diagnosticos
@@ -0,0 +1,134 @@
+# diagnosticos/motor_regras.py
+
+import operator
+import pandas as pd
+from typing import Dict, Any, List
+# Importa a função base para a criação do registro
+from .base_diagnosticos import criar_registro_diagnostico
+
+# ----------------------------------------------------------------------
+# MOTOR DE REGRAS DECLARATIVAS (limiares vindos do JSON de configuração)
+# ----------------------------------------------------------------------
+# Cada regra em 'regras_diagnostico' (eda_analises.json) tem o formato:
+#   {"id_diagnostico", "tipo_analise", "metrica", "operador", "limite",
+#    "coluna" (opcional, "*" = todas), "tabela" (opcional, "*" = todas),
+#    "severidade", "categoria", "mensagem", "detalhe", "recomendacao"}
+# O 'detalhe' aceita os campos {tabela}, {coluna}, {metrica}, {valor} e {limite}.
+
+OPERADORES = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+
+COLUNAS_METRICAS = ['tabela', 'tipo_analise', 'coluna', 'metrica', 'valor']
+
+def _eh_numero(valor: Any) -> bool:
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+def achatar_resultados(resultados_analise: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Achata os 'dados_resultado' numéricos de todas as análises em uma tabela
+    colunar (tabela, tipo_analise, coluna, metrica, valor).
+    Resultados por coluna ({coluna: {metrica: valor}}) e resultados planos
+    ({metrica: valor}, ex: chave primária) são suportados.
+    """
+    linhas = []
+    for resultado in resultados_analise:
+        tabela = resultado.get('tabela', 'N/A')
+        tipo_analise = resultado.get('tipo_analise', 'N/A')
+        dados = resultado.get('dados_resultado', {})
+        coluna_plana = dados.get('coluna_pk', 'N/A')
+
+        for chave, valor in dados.items():
+            if isinstance(valor, dict):
+                for metrica, valor_metrica in valor.items():
+                    if _eh_numero(valor_metrica):
+                        linhas.append((tabela, tipo_analise, chave, metrica, float(valor_metrica)))
+            elif _eh_numero(valor):
+                linhas.append((tabela, tipo_analise, coluna_plana, chave, float(valor)))
+
+    return pd.DataFrame(linhas, columns=COLUNAS_METRICAS)
+
+def compilar_regras(regras_config: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Valida as regras declarativas e as compila em um DataFrame pronto para o
+    join com a tabela de métricas.
+    """
+    regras = []
+    for regra in regras_config:
+        if regra.get('operador') not in OPERADORES:
+            raise ValueError(f"Operador não suportado na regra '{regra.get('id_diagnostico')}': '{regra.get('operador')}'. Suportados: {list(OPERADORES)}.")
+        regras.append({
+            "id_diagnostico": regra['id_diagnostico'],
+            "tipo_analise": regra['tipo_analise'],
+            "metrica": regra['metrica'],
+            "operador": regra['operador'],
+            "limite": float(regra['limite']),
+            "regra_coluna": regra.get('coluna', '*'),
+            "regra_tabela": regra.get('tabela', '*'),
+            "severidade": regra.get('severidade', 'INFO'),
+            "categoria": regra.get('categoria', 'QUALIDADE_DADOS'),
+            "mensagem": regra.get('mensagem', ''),
+            "detalhe": regra.get('detalhe', "{metrica}={valor} viola o limite {operador} {limite}."),
+            "recomendacao": regra.get('recomendacao', '')
+        })
+    return pd.DataFrame(regras)
+
+def avaliar_regras(metricas: pd.DataFrame, regras: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Avalia todas as regras de uma só vez sobre a tabela de métricas: um join
+    por (tipo_analise, metrica) seguido de um predicado vetorizado por operador.
+    Apenas as violações geram Registros de Diagnóstico, com evidência compacta.
+    """
+    if metricas.empty or regras.empty:
+        return []
+
+    candidatos = metricas.merge(regras, on=['tipo_analise', 'metrica'], how='inner')
+    if candidatos.empty:
+        return []
+
+    # Filtros de escopo (coluna/tabela específica ou curinga '*')
+    escopo = (
+        ((candidatos['regra_coluna'] == '*') | (candidatos['regra_coluna'] == candidatos['coluna'])) &
+        ((candidatos['regra_tabela'] == '*') | (candidatos['regra_tabela'] == candidatos['tabela']))
+    )
+    candidatos = candidatos[escopo]
+
+    # Predicado vetorizado, agrupado por operador
+    violacao = pd.Series(False, index=candidatos.index)
+    for simbolo, funcao in OPERADORES.items():
+        selecao = candidatos['operador'] == simbolo
+        if selecao.any():
+            violacao[selecao] = funcao(candidatos.loc[selecao, 'valor'], candidatos.loc[selecao, 'limite'])
+
+    diagnosticos = []
+    for linha in candidatos[violacao].itertuples(index=False):
+        diagnosticos.append(criar_registro_diagnostico(
+            id_diag=linha.id_diagnostico,
+            tabela=linha.tabela,
+            coluna=linha.coluna,
+            origem=linha.tipo_analise,
+            severidade=linha.severidade,
+            categoria=linha.categoria,
+            mensagem=linha.mensagem,
+            detalhe=linha.detalhe.format(
+                tabela=linha.tabela, coluna=linha.coluna, metrica=linha.metrica,
+                valor=linha.valor, operador=linha.operador, limite=linha.limite
+            ),
+            recomendacao=linha.recomendacao,
+            evidencia={"metrica": linha.metrica, "valor": linha.valor, "operador": linha.operador, "limite": linha.limite}
+        ))
+
+    return diagnosticos
+
+def diagnostico_por_regras(resultados_analise: List[Dict[str, Any]], regras_config: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Atalho: achata os resultados, compila as regras e as avalia em lote.
+    """
+    if not regras_config:
+        return []
+    return avaliar_regras(achatar_resultados(resultados_analise), compilar_regras(regras_config))
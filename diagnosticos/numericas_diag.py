@@ -7,50 +7,12 @@ from .base_diagnosticos import criar_registro_diagnostico
 # NOTA: A função auxiliar _criar_registro_diagnostico foi removida deste arquivo
 # e substituída pela importação de criar_registro_diagnostico.
 
-# ----------------------------------------------------------------------
-# Função de Diagnóstico 1: estatisticas_descritivas
-# ----------------------------------------------------------------------
-
-def diagnostico_estatistico(resultado_analise: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """
-    Gera diagnósticos básicos sobre a distribuição e magnitude das colunas.
-    (Ex: Detectar valores Min/Max irreais).
-    """
-    diagnosticos = []
-    tabela = resultado_analise.get('tabela', 'N/A')
-    dados = resultado_analise['dados_resultado']
-    origem = resultado_analise['tipo_analise']
-    
-    # Regras de Negócio (Mínimo aceitável)
-    REGRAS_MAGNITUDE = {
-        'idade': {'min_aceitavel': 18, 'mensagem': "Idade Mínima Irreal"},
-        'renda_mensal': {'min_aceitavel': 0.0, 'mensagem': "Renda Negativa/Zero"}
-    }
-    
-    for coluna, stats in dados.items():
-        min_valor = stats.get('min')
-        
-        # Aplica regra de Magnitude Mínima
-        if coluna in REGRAS_MAGNITUDE:
-            regra = REGRAS_MAGNITUDE[coluna]
-            if min_valor < regra['min_aceitavel']:
-                diagnosticos.append(criar_registro_diagnostico(
-                    id_diag="ESTAT_MAGNITUDE_001",
-                    tabela=tabela,
-                    coluna=coluna,
-                    origem=origem,
-                    severidade="CRÍTICO",
-                    categoria="QUALIDADE_DADOS",
-                    mensagem=regra['mensagem'],
-                    detalhe=f"O valor mínimo ({min_valor}) é menor que o limite aceitável ({regra['min_aceitavel']}).",
-                    recomendacao="Limpar ou imputar valores mínimos fora do domínio aceitável.",
-                    evidencia={"min_encontrado": min_valor, "min_esperado": regra['min_aceitavel']}
-                ))
-    
-    return diagnosticos
+# NOTA: Os limiares de magnitude (antes REGRAS_MAGNITUDE em diagnostico_estatistico)
+# agora ficam em 'regras_diagnostico' no eda_analises.json e são avaliados em lote
+# pelo motor de regras (motor_regras.py).
 
 # ----------------------------------------------------------------------
-# Função de Diagnóstico 2: teste_de_outliers_iqr
+# Função de Diagnóstico 1: teste_de_outliers_iqr
 # ----------------------------------------------------------------------
 
 def diagnostico_outliers_iqr(resultado_analise: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -83,7 +45,7 @@ def diagnostico_outliers_iqr(resultado_analise: Dict[str, Any]) -> List[Dict[str
     return diagnosticos
 
 # ----------------------------------------------------------------------
-# Função de Diagnóstico 3: teste_de_outliers_zscore
+# Função de Diagnóstico 2: teste_de_outliers_zscore
 # ----------------------------------------------------------------------
 
 def diagnostico_outliers_zscore(resultado_analise: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -116,7 +78,7 @@ def diagnostico_outliers_zscore(resultado_analise: Dict[str, Any]) -> List[Dict[
 
 
 # ----------------------------------------------------------------------
-# Função de Diagnóstico 4: analise_de_correlacao
+# Função de Diagnóstico 3: analise_de_correlacao
 # ----------------------------------------------------------------------
 
 def diagnostico_correlacao(resultado_analise: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -0,0 +1,73 @@
+# diagnosticos/perfil_diag.py
+
+from typing import Dict, Any, List
+# Importa a função base para a criação do registro
+from .base_diagnosticos import criar_registro_diagnostico
+
+# ----------------------------------------------------------------------
+# Função de Diagnóstico: perfil_tabela
+# ----------------------------------------------------------------------
+
+def diagnostico_perfil_tabela(resultado_analise: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Interpreta o perfil da tabela para sinalizar colunas totalmente nulas,
+    constantes ou com tipos misturados.
+    """
+    diagnosticos = []
+    tabela = resultado_analise.get('tabela', 'N/A')
+    dados = resultado_analise['dados_resultado']
+    origem = resultado_analise['tipo_analise']
+
+    for coluna, perfil in dados.items():
+
+        # Regra 1: COLUNA TOTALMENTE NULA
+        if perfil.get('distintos_aprox', 0) == 0:
+            diagnosticos.append(criar_registro_diagnostico(
+                id_diag="PERFIL_NULA_001",
+                tabela=tabela,
+                coluna=coluna,
+                origem=origem,
+                severidade="ALERTA",
+                categoria="QUALIDADE_DADOS",
+                mensagem="Coluna totalmente nula.",
+                detalhe=f"Todos os {perfil.get('nulos_count')} registros da coluna '{coluna}' são nulos.",
+                recomendacao="Verificar a extração/ETL da coluna ou removê-la da análise.",
+                evidencia={"nulos_count": perfil.get('nulos_count')}
+            ))
+            continue
+
+        # Regra 2: COLUNA CONSTANTE
+        if perfil.get('distintos_aprox') == 1:
+            diagnosticos.append(criar_registro_diagnostico(
+                id_diag="PERFIL_CONSTANTE_002",
+                tabela=tabela,
+                coluna=coluna,
+                origem=origem,
+                severidade="INFO",
+                categoria="MODELAGEM",
+                mensagem="Coluna constante.",
+                detalhe=f"A coluna '{coluna}' possui um único valor distinto ({perfil.get('percentual_nulos'):.2f}% nulos).",
+                recomendacao="Colunas sem variação não carregam informação para modelagem; considere removê-la.",
+                evidencia={"distintos_aprox": 1, "percentual_nulos": perfil.get('percentual_nulos')}
+            ))
+
+        # Regra 3: TIPOS MISTURADOS
+        if not perfil.get('tipo_consistente', True):
+            if 'percentual_numerico' in perfil:
+                detalhe = f"{perfil['percentual_numerico']:.2f}% dos valores não nulos da coluna '{coluna}' são numéricos e o restante é texto."
+            else:
+                detalhe = f"A coluna '{coluna}' contém valores de tipos diferentes (tipo inferido: {perfil.get('tipo_inferido')})."
+            diagnosticos.append(criar_registro_diagnostico(
+                id_diag="PERFIL_TIPO_003",
+                tabela=tabela,
+                coluna=coluna,
+                origem=origem,
+                severidade="ALERTA",
+                categoria="QUALIDADE_DADOS",
+                mensagem="Coluna com tipos misturados.",
+                detalhe=detalhe,
+                recomendacao="Padronizar o tipo da coluna na origem ou converter/limpar os valores fora do padrão.",
+                evidencia={"tipo_inferido": perfil.get('tipo_inferido'), "percentual_numerico": perfil.get('percentual_numerico')}
+            ))
+
+    return diagnosticos
@@ -6,6 +6,9 @@ from datetime import datetime
 import os
 import sys
 import importlib
+import sqlite3
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # ----------------------------------------------------------------------
 # SOLUÇÃO PARA MODULE RESOLUTION
@@ -21,11 +24,18 @@ if current_dir not in sys.path:
 # ----------------------------------------------------------------------
 
 try:
-    from data_loader.loader import load_data
+    from data_loader.loader import load_data, particionar_csv, detectar_formato_csv, montar_consulta_sqlite, listar_partes, ler_cabecalho, colunas_cabecalho, EXTENSOES_COMPRIMIDAS
 except ImportError:
     print("ERRO: O módulo 'data_loader.loader' com a função 'load_data' não foi encontrado.")
     exit()
 
+from data_loader.prefetch import iterar_com_prefetch
+from data_loader.historico import gerar_id_execucao
+from analises.particionado import ESTADOS_MESCLAVEIS, SEGUNDA_PASSADA_BUCKETS, N_BUCKETS_PK, processar_faixa_csv, processar_parte_csv
+from analises.pushdown_sql import PUSHDOWN_SQL
+from analises.orcamento import iniciar_orcamento_tabela, obter_orcamento, executar_com_fallback, executar_sql_com_orcamento, obter_contexto_processos
+from diagnosticos.motor_regras import diagnostico_por_regras
+
 # Dicionários que armazenarão as funções importadas dinamicamente
 ANALYSIS_MAPPER = {}
 DIAGNOSTIC_MAPPER = {}
@@ -85,8 +95,16 @@ def build_dispatchers(analises_config):
 # 2. FUNÇÕES AUXILIARES E FLUXO PRINCIPAL
 # ----------------------------------------------------------------------
 
-def get_columns_by_type(meta: dict, alvo_tipos: list) -> list:
-    """Extrai a lista de colunas da metatabela com base no tipo."""
+def get_columns_by_type(meta: dict, alvo_tipos: list, colunas_df: list = None) -> list:
+    """
+    Extrai a lista de colunas da metatabela com base no tipo.
+    O alvo especial 'todas_colunas' seleciona todas as colunas do DataFrame
+    ('colunas_df'), exceto as de 'colunas_ignorar'.
+    """
+    if 'todas_colunas' in alvo_tipos and colunas_df is not None:
+        ignorar = set(meta.get('colunas_ignorar', []))
+        return [col for col in colunas_df if col not in ignorar]
+
     colunas_encontradas = set()
     for tipo in alvo_tipos:
         if tipo in meta:
@@ -98,24 +116,88 @@ def get_columns_by_type(meta: dict, alvo_tipos: list) -> list:
     return list(colunas_encontradas)
 
 
-def executar_analise(metadata: dict, analises_config: dict) -> list:
-    """FASE 1: Itera sobre tabelas e regras para coletar resultados padronizados."""
+def executar_analise(metadata: dict, analises_config: dict, dataframes: dict = None, ao_concluir_tabela=None, id_execucao: str = None) -> list:
+    """
+    FASE 1: Itera sobre tabelas e regras para coletar resultados padronizados.
+    Se 'dataframes' contiver um DataFrame para a tabela (chave = nome_tabela),
+    ele é usado diretamente e o load_data não é chamado.
+    A carga da tabela i+1 ocorre em segundo plano enquanto a tabela i é analisada
+    (chave 'execucao' do eda_analises.json: 'profundidade_prefetch' e
+    'limite_memoria_prefetch_mb'). Se informado, 'ao_concluir_tabela' recebe a
+    lista de resultados de cada tabela assim que ela é concluída.
+    'id_execucao' (gerado uma única vez se omitido) é repassado a todas as regras
+    de todas as tabelas, identificando a execução no histórico de perfis.
+    """
     
     print("--- INICIANDO FASE DE ANÁLISE (Coleta de Fatos) ---")
     resultados_analise = []
+    dataframes = dataframes or {}
+    id_execucao = id_execucao or gerar_id_execucao()
+    config_execucao = analises_config.get('execucao', {})
 
-    for meta_tabela in metadata['tabelas']:
+    def carregar_tabela(meta_tabela: dict):
+        # Apenas fontes de arquivo lidas por inteiro são pré-carregadas
+        if meta_tabela['nome_tabela'] in dataframes:
+            return dataframes[meta_tabela['nome_tabela']]
+        if meta_tabela.get('particoes', 1) > 1 or meta_tabela['tipo_arquivo'].lower().strip() == 'sqlite':
+            return None
+        return load_data(meta_tabela['caminho_arquivo'], meta_tabela['tipo_arquivo'])
+
+    tabelas_carregadas = iterar_com_prefetch(
+        metadata['tabelas'],
+        carregar_tabela,
+        profundidade=config_execucao.get('profundidade_prefetch', 1),
+        limite_memoria_mb=config_execucao.get('limite_memoria_prefetch_mb')
+    )
+
+    for meta_tabela, df_carregado, erro_carga in tabelas_carregadas:
         tabela_nome = meta_tabela['nome_tabela']
         print(f"\n[TABELA: {tabela_nome}]")
+        resultados_tabela = []
+
+        if meta_tabela.get('particoes', 1) > 1 and tabela_nome not in dataframes:
+            try:
+                resultados_tabela = executar_analise_particionada(meta_tabela, analises_config)
+            except Exception as e:
+                print(f"   ! ERRO FATAL na análise particionada ({e.__class__.__name__}). Pulando. Erro: {e}")
+            resultados_analise.extend(resultados_tabela)
+            if ao_concluir_tabela is not None and resultados_tabela:
+                ao_concluir_tabela(resultados_tabela)
+            continue
         
+        df = df_carregado
+        conexao = None
+        consulta = montar_consulta_sqlite(meta_tabela)
         try:
-            df = load_data(meta_tabela['caminho_arquivo'], meta_tabela['tipo_arquivo']) 
+            if erro_carga is not None:
+                raise erro_carga
+            if tabela_nome in dataframes:
+                print(f"   --> DataFrame em memória de {len(df)} linhas.")
+            elif df is not None:
+                for aviso in df.attrs.pop('avisos_carga', []):
+                    print(f"   --> Aviso: {aviso}")
+                print(f"   --> Carregado {meta_tabela['tipo_arquivo']} de {len(df)} linhas.")
+            elif meta_tabela['tipo_arquivo'].lower().strip() == 'sqlite':
+                # Fonte SQLite: agregados vão para o banco; busca completa só sob demanda
+                if not consulta:
+                    raise ValueError("Fonte 'sqlite' requer 'tabela_sql' ou 'consulta_sql' na metatabela.")
+                if not os.path.exists(meta_tabela['caminho_arquivo']):
+                    raise FileNotFoundError(f"Arquivo de dados não encontrado no caminho: {meta_tabela['caminho_arquivo']}")
+                conexao = sqlite3.connect(meta_tabela['caminho_arquivo'])
+                print("   --> Fonte SQLite conectada (pushdown de agregados habilitado).")
         except NotImplementedError:
              print("   ! ERRO: Implementação de load_data ausente ou incompleta. Pulando.")
              continue
         except Exception as e:
             print(f"   ! ERRO FATAL ao carregar dados ({e.__class__.__name__}). Pulando. Erro: {e}")
             continue
+
+
+        # Índice de valores ordenados por coluna, construído sob demanda uma única
+        # vez por tabela e compartilhado entre as regras (ex: outliers IQR/Z-Score)
+        indice_ordenado = {}
+        # Prazo total da tabela ('orcamentos_tabela'), consumido pelas regras em sequência
+        orcamento_tabela = iniciar_orcamento_tabela(tabela_nome, analises_config)
             
         for regra in analises_config.get('regras_globais_eda', []):
             tipo_analise = regra['tipo_analise']
@@ -124,13 +206,40 @@ def executar_analise(metadata: dict, analises_config: dict) -> list:
             if tipo_analise not in ANALYSIS_MAPPER:
                 continue
 
-            colunas_para_analise = get_columns_by_type(meta_tabela, alvo_tipo)
+            if 'todas_colunas' in alvo_tipo and df is None:
+                # Fonte SQLite: as colunas só são conhecidas após a busca completa
+                try:
+                    df = load_data(meta_tabela['caminho_arquivo'], meta_tabela['tipo_arquivo'], consulta)
+                    print(f"   --> Carregado SQLite de {len(df)} linhas.")
+                except Exception as e:
+                    print(f"   ! ERRO ao carregar dados para '{tipo_analise}' ({e.__class__.__name__}): {e}")
+                    continue
+
+            colunas_para_analise = get_columns_by_type(meta_tabela, alvo_tipo, df.columns.tolist() if df is not None else None)
             
             if colunas_para_analise:
                 print(f"   -> Executando '{tipo_analise}' em colunas: {colunas_para_analise}")
                 try:
                     funcao_analise = ANALYSIS_MAPPER[tipo_analise]
-                    resultado = funcao_analise(df, colunas_para_analise, **regra.get('parametros', {}))
+                    if conexao is not None and funcao_analise.__name__ in PUSHDOWN_SQL:
+                        funcao_sql = PUSHDOWN_SQL[funcao_analise.__name__]
+                        orcamento = obter_orcamento(regra, orcamento_tabela)
+                        if orcamento:
+                            resultado = executar_sql_com_orcamento(funcao_sql, conexao, consulta, colunas_para_analise, regra.get('parametros', {}), orcamento)
+                        else:
+                            resultado = funcao_sql(conexao, consulta, colunas_para_analise, **regra.get('parametros', {}))
+                    else:
+                        if df is None:
+                            # Regra precisa dos dados linha a linha: busca completa (fetchmany)
+                            df = load_data(meta_tabela['caminho_arquivo'], meta_tabela['tipo_arquivo'], consulta)
+                            print(f"   --> Carregado SQLite de {len(df)} linhas.")
+                        parametros_regra = {'indice_ordenado': indice_ordenado, 'tabela_nome': tabela_nome, 'id_execucao': id_execucao, **regra.get('parametros', {})}
+                        orcamento = obter_orcamento(regra, orcamento_tabela)
+                        if orcamento:
+                            # Regra com orçamento: executa em worker supervisionado com fallback
+                            resultado = executar_com_fallback(funcao_analise, df, colunas_para_analise, parametros_regra, orcamento, regra.get('fallback'), orcamento_tabela.get('prazo'))
+                        else:
+                            resultado = funcao_analise(df, colunas_para_analise, **parametros_regra)
                     
                     if not isinstance(resultado, dict):
                          print(f"   ! Tipo de Retorno INVÁLIDO: {type(resultado)}. Pulando coleta.")
@@ -142,23 +251,131 @@ def executar_analise(metadata: dict, analises_config: dict) -> list:
                     resultado['tipo_alvo_meta'] = alvo_tipo
 
                     # 2. Adição
-                    resultados_analise.append(resultado)
+                    resultados_tabela.append(resultado)
                     print(f"   -> SUCESSO na análise: Resultado coletado.") 
                     
                 except Exception as e:
                     print(f"   ! ERRO CRÍTICO na coleta de resultado '{tipo_analise}' ({e.__class__.__name__}). Detalhe: {e}")
                     print(f"     Detalhe do Erro: {e}")
-                    print("     O resultado não foi adicionado à lista mestra.")                    
+                    print("     O resultado não foi adicionado à lista mestra.")
+
+        if conexao is not None:
+            conexao.close()
+
+        resultados_analise.extend(resultados_tabela)
+        if ao_concluir_tabela is not None and resultados_tabela:
+            ao_concluir_tabela(resultados_tabela)
     return resultados_analise
 
-def executar_diagnostico(resultados_analise: list) -> tuple:
-    """FASE 2: Itera sobre resultados de análise para gerar registros de diagnóstico JSON."""
-    
-    print("\n--- INICIANDO FASE DE DIAGNÓSTICO (Interpretação e Regras) ---")
+def executar_analise_particionada(meta_tabela: dict, analises_config: dict) -> list:
+    """
+    FASE 1 (modo particionado): divide um único CSV em 'particoes' faixas de bytes
+    alinhadas a quebras de linha (ou, para diretório/glob/arquivos comprimidos,
+    usa cada parte como unidade), processa cada unidade em um processo separado
+    acumulando estados mescláveis e mescla os estados parciais no resultado padrão.
+    Regras sem forma mesclável (ver analises/particionado.py) são ignoradas.
+    A validação de PK usa arquivos de spill por bucket em um diretório temporário
+    ('diretorio_temporario' na metatabela, ou o padrão do sistema) e uma segunda
+    passada em que cada bucket é contado por um único worker.
+    """
+    tabela_nome = meta_tabela['nome_tabela']
+    caminho = meta_tabela['caminho_arquivo']
+
+    if meta_tabela['tipo_arquivo'].lower().strip() != 'csv':
+        raise ValueError(f"Modo particionado suporta apenas 'csv', recebido: '{meta_tabela['tipo_arquivo']}'.")
+
+    partes = listar_partes(caminho)
+    if not partes:
+        raise FileNotFoundError(f"Arquivo de dados não encontrado no caminho: {caminho}")
+
+    if len(partes) > 1 or partes[0].lower().endswith(EXTENSOES_COMPRIMIDAS):
+        cabecalho = ler_cabecalho(partes[0])
+        sep, encoding = detectar_formato_csv(cabecalho)
+        unidades = [(processar_parte_csv, (parte, sep, encoding)) for parte in partes]
+        print(f"   --> {len(partes)} parte(s) processadas como unidades (sep='{sep}', encoding='{encoding}').")
+    else:
+        cabecalho, faixas = particionar_csv(partes[0], meta_tabela['particoes'])
+        sep, encoding = detectar_formato_csv(cabecalho)
+        unidades = [(processar_faixa_csv, (partes[0], inicio, fim, cabecalho, sep, encoding)) for inicio, fim in faixas]
+        print(f"   --> CSV particionado em {len(faixas)} faixa(s) (sep='{sep}', encoding='{encoding}').")
+
+    # Colunas lidas do cabeçalho, para resolver o alvo 'todas_colunas'
+    colunas_arquivo = colunas_cabecalho(cabecalho, sep, encoding)
+
+    tarefas = []
+    regras_tarefas = []
+    orcamento_tabela = iniciar_orcamento_tabela(tabela_nome, analises_config)
+    for regra in analises_config.get('regras_globais_eda', []):
+        tipo_analise = regra['tipo_analise']
+        if tipo_analise not in ANALYSIS_MAPPER:
+            continue
+
+        colunas_para_analise = get_columns_by_type(meta_tabela, regra['alvo_tipo'], colunas_arquivo)
+        if not colunas_para_analise:
+            continue
+
+        funcao_analise_nome = ANALYSIS_MAPPER[tipo_analise].__name__
+        if funcao_analise_nome not in ESTADOS_MESCLAVEIS:
+            print(f"   ! '{tipo_analise}' não possui forma mesclável. Ignorada no modo particionado.")
+            continue
+
+        print(f"   -> Agendando '{tipo_analise}' em colunas: {colunas_para_analise}")
+        orcamento = obter_orcamento(regra, orcamento_tabela)
+        if orcamento:
+            print(f"   ! Orçamento de '{tipo_analise}' ({orcamento}) não é aplicado no modo particionado. Ignorado.")
+        tarefas.append((funcao_analise_nome, colunas_para_analise, regra.get('parametros', {})))
+        regras_tarefas.append(regra)
+
+    if not tarefas:
+        return []
+
+    max_workers = min(len(unidades), meta_tabela['particoes'], os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory(prefix='eda_spill_', dir=meta_tabela.get('diretorio_temporario')) as diretorio_spill, \
+            ProcessPoolExecutor(max_workers=max_workers, mp_context=obter_contexto_processos()) as executor:
+
+        # Cada tarefa com segunda passada recebe o seu próprio diretório de spill
+        for i, (funcao_analise_nome, colunas, parametros) in enumerate(tarefas):
+            if funcao_analise_nome in SEGUNDA_PASSADA_BUCKETS:
+                diretorio_tarefa = os.path.join(diretorio_spill, f"tarefa_{i}")
+                os.makedirs(diretorio_tarefa)
+                tarefas[i] = (funcao_analise_nome, colunas, {**parametros, 'diretorio_spill': diretorio_tarefa})
+
+        # Primeira passada: estados mescláveis (e spill por bucket)
+        futuros = [executor.submit(funcao, *argumentos, tarefas) for funcao, argumentos in unidades]
+        parciais = [futuro.result() for futuro in futuros]
+
+        resultados = []
+        for i, ((funcao_analise_nome, colunas, parametros), regra) in enumerate(zip(tarefas, regras_tarefas)):
+            _, mesclar_fn, finalizar_fn = ESTADOS_MESCLAVEIS[funcao_analise_nome]
+            estado = None
+            for estados_faixa in parciais:
+                if estados_faixa[i] is not None:
+                    estado = estados_faixa[i] if estado is None else mesclar_fn(estado, estados_faixa[i])
+            if estado is None:
+                continue
+
+            # Segunda passada: cada bucket é processado por um único worker
+            if funcao_analise_nome in SEGUNDA_PASSADA_BUCKETS:
+                chave_estado, funcao_bucket = SEGUNDA_PASSADA_BUCKETS[funcao_analise_nome]
+                futuros_bucket = [
+                    executor.submit(funcao_bucket, parametros['diretorio_spill'], bucket)
+                    for bucket in range(N_BUCKETS_PK)
+                ]
+                estado[chave_estado] = sum(futuro.result() for futuro in futuros_bucket)
+
+            resultado = finalizar_fn(estado, colunas, **parametros)
+            resultado['tabela'] = tabela_nome
+            resultado['tipo_analise'] = regra['tipo_analise']
+            resultado['tipo_alvo_meta'] = regra['alvo_tipo']
+            resultados.append(resultado)
+            print(f"   -> SUCESSO na análise particionada '{regra['tipo_analise']}': Resultado coletado.")
+
+    return resultados
+
+def diagnosticar_resultados(resultados_analise: list) -> list:
+    """Aplica as funções de diagnóstico (DIAGNOSTIC_MAPPER) a uma lista de resultados."""
     diagnosticos_registrados = []
-    total_alertas = 0
-    total_criticos = 0
-    
+
     for resultado in resultados_analise:
         tipo_analise = resultado['tipo_analise']
         
@@ -167,23 +384,55 @@ def executar_diagnostico(resultados_analise: list) -> tuple:
                 funcao_diagnostico = DIAGNOSTIC_MAPPER[tipo_analise]
                 
                 registros = funcao_diagnostico(resultado)
-                
-                for registro in registros:
-                    diagnosticos_registrados.append(registro)
-                    if registro.get('severidade') == "ALERTA":
-                        total_alertas += 1
-                    elif registro.get('severidade') == "CRÍTICO":
-                        total_criticos += 1
+                diagnosticos_registrados.extend(registros)
             except Exception as e:
                 print(f"   ! ERRO no diagnóstico da análise '{tipo_analise}' ({e.__class__.__name__}): {e}")
+
+    return diagnosticos_registrados
+
+def executar_diagnostico(resultados_analise: list, regras_diagnostico: list = None, diagnosticos_previos: list = None) -> tuple:
+    """
+    FASE 2: Itera sobre resultados de análise para gerar registros de diagnóstico JSON.
+    As 'regras_diagnostico' declarativas são avaliadas em lote, sobre todas as
+    tabelas de uma só vez, pelo motor de regras. Se 'diagnosticos_previos' for
+    informado (diagnósticos já emitidos tabela a tabela), as funções de
+    diagnóstico não são reaplicadas.
+    """
+    
+    print("\n--- INICIANDO FASE DE DIAGNÓSTICO (Interpretação e Regras) ---")
+    if diagnosticos_previos is None:
+        diagnosticos_registrados = diagnosticar_resultados(resultados_analise)
+    else:
+        diagnosticos_registrados = list(diagnosticos_previos)
+
+    if regras_diagnostico:
+        try:
+            diagnosticos_registrados.extend(diagnostico_por_regras(resultados_analise, regras_diagnostico))
+        except Exception as e:
+            print(f"   ! ERRO no motor de regras de diagnóstico ({e.__class__.__name__}): {e}")
+
+    # Diagnósticos de resultados obtidos por fallback herdam a indicação de precisão reduzida
+    fallbacks = {
+        (resultado.get('tabela'), resultado.get('tipo_analise')): resultado['fallback']
+        for resultado in resultados_analise if 'fallback' in resultado
+    }
+    if fallbacks:
+        for registro in diagnosticos_registrados:
+            chave = (registro.get('tabela'), registro.get('tipo_analise_origem'))
+            if chave in fallbacks:
+                registro['fallback'] = fallbacks[chave]
+
+    total_alertas = sum(1 for registro in diagnosticos_registrados if registro.get('severidade') == "ALERTA")
+    total_criticos = sum(1 for registro in diagnosticos_registrados if registro.get('severidade') == "CRÍTICO")
         
     return diagnosticos_registrados, total_alertas, total_criticos
 
-def construir_saida_final(diagnosticos_registrados: list, metadata: dict, total_alertas: int, total_criticos: int, total_analises_concluidas: int) -> dict:
+def construir_saida_final(diagnosticos_registrados: list, metadata: dict, total_alertas: int, total_criticos: int, total_analises_concluidas: int, id_execucao: str = None) -> dict:
     """Constrói o JSON de saída final padronizado para uso em pipelines."""
     
     resumo = {
         "data_execucao": datetime.now().isoformat(),
+        "id_execucao": id_execucao,
         "total_tabelas": len(metadata['tabelas']),
         "total_analises_executadas": total_analises_concluidas, # Usa a contagem real
         "total_alertas": total_alertas,
@@ -196,7 +445,83 @@ def construir_saida_final(diagnosticos_registrados: list, metadata: dict, total_
     }
 
 # ----------------------------------------------------------------------
-# 3. FUNÇÃO PRINCIPAL
+# 3. API EM PROCESSO (DataFrames em memória)
+# ----------------------------------------------------------------------
+
+def montar_metadata_memoria(tabelas: dict, metadata: dict = None) -> dict:
+    """
+    Monta a metatabela para DataFrames em memória. Tabelas sem entrada em
+    'metadata' recebem uma entrada mínima com as colunas numéricas inferidas
+    pelo dtype.
+    """
+    metas_existentes = {m['nome_tabela']: m for m in (metadata or {}).get('tabelas', [])}
+    metas = []
+    for nome, df in tabelas.items():
+        if nome in metas_existentes:
+            metas.append(metas_existentes[nome])
+        else:
+            metas.append({
+                "nome_tabela": nome,
+                "colunas_numericas": df.select_dtypes(include='number').columns.tolist()
+            })
+    return {"tabelas": metas}
+
+
+def run_eda(tabelas: dict, analises_config: dict, metadata: dict = None) -> dict:
+    """
+    API em processo: executa o pipeline completo e retorna o relatório final
+    (mesma estrutura do JSON exportado), sem ler nem escrever arquivos de saída.
+
+    Args:
+        tabelas (dict): Metatabela no formato de 'eda_tabelas.json' (dados lidos
+            do disco via load_data) ou um dicionário {nome_tabela: DataFrame}.
+        analises_config (dict): Regras no formato de 'eda_analises.json'.
+        metadata (dict): Metatabela opcional com os tipos de coluna para os
+            DataFrames em memória (chave 'tabelas', casada por 'nome_tabela').
+
+    Returns:
+        dict: O relatório final (resumo_execucao + diagnosticos_registrados).
+    """
+    if isinstance(tabelas.get('tabelas'), list):
+        metadata_execucao = tabelas
+        dataframes = {}
+    else:
+        metadata_execucao = montar_metadata_memoria(tabelas, metadata)
+        dataframes = tabelas
+
+    build_dispatchers(analises_config)
+    id_execucao = gerar_id_execucao()
+
+    # Fase 1: Análise. Os diagnósticos de cada tabela são emitidos em uma thread
+    # à parte enquanto a tabela seguinte é analisada.
+    with ThreadPoolExecutor(max_workers=1) as executor_diagnostico:
+        futuros_diagnostico = []
+        resultados_fase_analise = executar_analise(
+            metadata_execucao, analises_config, dataframes,
+            id_execucao=id_execucao,
+            ao_concluir_tabela=lambda resultados: futuros_diagnostico.append(
+                executor_diagnostico.submit(diagnosticar_resultados, resultados)
+            )
+        )
+        diagnosticos_por_tabela = [registro for futuro in futuros_diagnostico for registro in futuro.result()]
+    total_analises_concluidas = len(resultados_fase_analise)
+
+    # Fase 2: Diagnóstico (motor de regras em lote sobre todas as tabelas)
+    registros_fase_diagnostico, total_alertas, total_criticos = executar_diagnostico(
+        resultados_fase_analise, analises_config.get('regras_diagnostico', []), diagnosticos_por_tabela
+    )
+
+    return construir_saida_final(
+        registros_fase_diagnostico, 
+        metadata_execucao, 
+        total_alertas, 
+        total_criticos,
+        total_analises_concluidas,
+        id_execucao
+    )
+
+# ----------------------------------------------------------------------
+# 4. FUNÇÃO PRINCIPAL
 # ----------------------------------------------------------------------
 
 def main():
@@ -216,25 +541,8 @@ def main():
         print("Erro: Falha ao decodificar JSON em um dos arquivos de configuração.")
         return
 
-    build_dispatchers(analises_config)
-
     # Executar Pipeline
-    
-    # Fase 1: Análise
-    resultados_fase_analise = executar_analise(metadata, analises_config)
-    total_analises_concluidas = len(resultados_fase_analise)
-
-    # Fase 2: Diagnóstico
-    registros_fase_diagnostico, total_alertas, total_criticos = executar_diagnostico(resultados_fase_analise)
-
-    # Construir e Exportar
-    relatorio_final = construir_saida_final(
-        registros_fase_diagnostico, 
-        metadata, 
-        total_alertas, 
-        total_criticos,
-        total_analises_concluidas
-    )
+    relatorio_final = run_eda(metadata, analises_config)
 
     # Exportar JSON (Saída para Pipeline)
     output_filename = 'relatorio_eda_final.json'
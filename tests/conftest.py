@@ -0,0 +1,9 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# Permite importar 'analises', 'diagnosticos', 'data_loader' e 'main_runner'
+RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ_PROJETO not in sys.path:
+    sys.path.insert(0, RAIZ_PROJETO)
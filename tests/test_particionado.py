@@ -0,0 +1,66 @@
+# tests/test_particionado.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import main_runner
+from analises.integridade import validacao_chave_primaria
+from analises.numericas import estatisticas_descritivas
+
+ANALISES_CONFIG = {
+    "regras_globais_eda": [
+        {
+            "tipo_analise": "validacao_chave_primaria",
+            "alvo_tipo": ["chave_primaria"],
+            "modulo": "integridade",
+            "funcao_analise": "validacao_chave_primaria"
+        },
+        {
+            "tipo_analise": "estatisticas_descritivas",
+            "alvo_tipo": ["colunas_numericas"],
+            "modulo": "numericas",
+            "funcao_analise": "estatisticas_descritivas"
+        }
+    ]
+}
+
+@pytest.fixture
+def csv_com_nulos_e_duplicados(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 20000
+    df = pd.DataFrame({
+        "id": np.arange(n).astype(float),
+        "valor": rng.normal(100, 15, n)
+    })
+    # 2 nulos e 1 chave duplicada: keep=False conta 4 linhas duplicadas
+    df.loc[[10, 15000], "id"] = np.nan
+    df.loc[19999, "id"] = 5.0
+    caminho = tmp_path / "tabela.csv"
+    df.to_csv(caminho, sep=';', index=False)
+    return caminho
+
+def test_particionado_equivale_ao_caminho_em_memoria(csv_com_nulos_e_duplicados):
+    caminho = str(csv_com_nulos_e_duplicados)
+    meta = {
+        "nome_tabela": "t",
+        "caminho_arquivo": caminho,
+        "tipo_arquivo": "csv",
+        "chave_primaria": "id",
+        "colunas_numericas": ["valor"],
+        "particoes": 3
+    }
+    main_runner.build_dispatchers(ANALISES_CONFIG)
+    resultados = {r['tipo_analise']: r for r in main_runner.executar_analise_particionada(meta, ANALISES_CONFIG)}
+
+    df = pd.read_csv(caminho, sep=';')
+    esperado_pk = validacao_chave_primaria(df, ["id"])['dados_resultado']
+    obtido_pk = resultados['validacao_chave_primaria']['dados_resultado']
+    assert obtido_pk['duplicados_count'] == esperado_pk['duplicados_count'] == 4
+    assert obtido_pk['nulos_count'] == esperado_pk['nulos_count'] == 2
+    assert obtido_pk['total_registros'] == esperado_pk['total_registros']
+
+    esperado_desc = estatisticas_descritivas(df, ["valor"])['dados_resultado']['valor']
+    obtido_desc = resultados['estatisticas_descritivas']['dados_resultado']['valor']
+    for chave in ("count", "mean", "std", "min", "max"):
+        assert obtido_desc[chave] == pytest.approx(esperado_desc[chave], abs=1e-3)
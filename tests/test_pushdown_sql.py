@@ -0,0 +1,61 @@
+# tests/test_pushdown_sql.py
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analises.integridade import validacao_chave_primaria
+from analises.numericas import estatisticas_descritivas
+from analises.pushdown_sql import validacao_chave_primaria_sql, estatisticas_descritivas_sql
+
+ORIGEM = 'SELECT * FROM "tabela"'
+
+@pytest.fixture
+def tabela_sqlite():
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame({
+        "id": np.arange(n).astype(float),
+        # Média alta e desvio pequeno: exercita a estabilidade da soma dos quadrados
+        "valor": rng.normal(1e9, 3, n),
+        "idade": rng.integers(0, 100, n).astype(float)
+    })
+    # 2 nulos e 1 chave duplicada: keep=False conta 4 linhas duplicadas
+    df.loc[[10, 3000], "id"] = np.nan
+    df.loc[4999, "id"] = 5.0
+    df.loc[::7, "idade"] = np.nan
+    conexao = sqlite3.connect(":memory:")
+    df.to_sql("tabela", conexao, index=False)
+    yield conexao, df
+    conexao.close()
+
+def test_pk_pushdown_equivale_ao_caminho_em_memoria(tabela_sqlite):
+    conexao, df = tabela_sqlite
+    esperado = validacao_chave_primaria(df, ["id"])
+    obtido = validacao_chave_primaria_sql(conexao, ORIGEM, ["id"])
+
+    assert obtido['status'] == esperado['status'] == "ALERTA"
+    for chave in ("total_registros", "nulos_count", "duplicados_count"):
+        assert obtido['dados_resultado'][chave] == esperado['dados_resultado'][chave]
+    assert obtido['dados_resultado']['duplicados_count'] == 4
+
+def test_pk_pushdown_coluna_inexistente_retorna_erro(tabela_sqlite):
+    conexao, _ = tabela_sqlite
+    resultado = validacao_chave_primaria_sql(conexao, ORIGEM, ["nao_existe"])
+
+    assert resultado['status'] == "ERRO"
+    assert resultado['dados_resultado'] == {}
+
+def test_descritivas_pushdown_equivale_ao_caminho_em_memoria(tabela_sqlite):
+    conexao, df = tabela_sqlite
+    colunas = ["valor", "idade"]
+    esperado = estatisticas_descritivas(df, colunas)['dados_resultado']
+    obtido = estatisticas_descritivas_sql(conexao, ORIGEM, colunas)
+
+    assert obtido['status'] == "SUCESSO"
+    for col in colunas:
+        assert obtido['dados_resultado'][col].keys() == esperado[col].keys()
+        for chave, valor in esperado[col].items():
+            assert obtido['dados_resultado'][col][chave] == pytest.approx(valor, abs=1e-3)